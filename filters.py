@@ -11,7 +11,6 @@ import numpy            as     np
 import astropy.io.fits  as     fits
 from   astropy.table    import Table
 from   copy             import deepcopy
-from   functools        import partialmethod
 
 from   numpy            import ndarray
 from   typing           import Tuple, List, Union, Any, Optional
@@ -297,6 +296,9 @@ class FilterList:
         if np.all(mask):
             raise ValueError('SED fitting stopped because mask contains True values everywhere. Please provide a mask with True values for pixels to mask and False values for pixels to fit.')
         
+        #: Tables already generated by setCode, indexed by SED fitting code and genTable parameters (cleared when the filters, the mask or the redshift are set)
+        self._tableCache = {}
+        
         # :Redshift of the galaxy
         self.redshift = redshift
         
@@ -324,6 +326,62 @@ class FilterList:
                     
         # Set SED fitting code. This rebuilds the table since SED fitting codes do not expect tables with the same columns
         self.setCode(code, **kwargs)
+        
+        
+    ##########################
+    #       Properties       #
+    ##########################
+    
+    @property
+    def redshift(self, *args, **kwargs) -> Union[int, float]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Redshift of the galaxy. Setting it clears the tables cached by :py:meth:`~FilterList.setCode`.
+        '''
+        
+        return self._redshift
+    
+    @redshift.setter
+    def redshift(self, redshift: Union[int, float]) -> None:
+        
+        self._redshift = redshift
+        self._tableCache.clear()
+        return
+    
+    @property
+    def mask(self, *args, **kwargs) -> ndarray:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Mask for bad pixels. Setting it clears the tables cached by :py:meth:`~FilterList.setCode`.
+        '''
+        
+        return self._mask
+    
+    @mask.setter
+    def mask(self, mask: ndarray) -> None:
+        
+        self._mask = mask
+        self._tableCache.clear()
+        return
+    
+    @property
+    def filters(self, *args, **kwargs) -> List[Filter]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Filter list. Setting it clears the tables cached by :py:meth:`~FilterList.setCode`.
+        '''
+        
+        return self._filters
+    
+    @filters.setter
+    def filters(self, filters: List[Filter]) -> None:
+        
+        self._filters = filters
+        self._tableCache.clear()
+        return
        
         
     ###############################
@@ -489,6 +547,9 @@ class FilterList:
         # Compute mean map to scale data
         meanMap, _                 = self.computeMeanMap(maskVal=0)
         
+        # The mean map is the same for all the filters, so its non-null mask and inverse are only computed once
+        inverse                    = self.normInverse(meanMap)
+        
         data               = []
         var                = []
        
@@ -503,7 +564,7 @@ class FilterList:
                                                )
             
             # Scale data to have compatible values with LePhare for the flux
-            d, v           = self.scale(d, v, meanMap, factor=scaleFactor)
+            d, v           = self.scale(d, v, meanMap, factor=scaleFactor, inverse=inverse)
             
             data.append(d)
             var.append( v)
@@ -856,7 +917,7 @@ class FilterList:
         return data, err
     
     @staticmethod
-    def poissonVar(data2: ndarray, texp: Union[int, float] = 1, texpFac: Union[int, float] = 1, **kwargs) -> ndarray:
+    def poissonVar(data2: ndarray, texp: Union[int, float] = 1, texpFac: Union[int, float] = 1, dtype: Optional[Any] = None, nonNeg: bool = False, **kwargs) -> ndarray:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
         
@@ -884,15 +945,25 @@ class FilterList:
         :type texp: :python:`int` or :python:`float`
         :param texpFac: exposure factor
         :type texpFac: :python:`int` or :python:`float`
+        :param dtype: if not :python:`None`, **data2** is cast to this type before computing the variance (e.g. :python:`np.float32` to halve the memory footprint)
+        :param nonNeg: whether **data2** is known to be non-negative. If :python:`True`, the absolute value is not computed.
+        :type nonNeg: :python:`bool`
         
-        :raises TypeError: if **texp** or **texpFac** are not both :python:`int` or :python:`float`
+        :raises TypeError:
+            
+            * if **data2** is a masked array
+            * if **texp** or **texpFac** are not both :python:`int` or :python:`float`
+            
         :raises ValueError:
             
             * if :python:`texp <= 0`
             * if :python:`texpFac < 0`
         '''
         
-        if not all([isinstance(i, (int, float)) for i in [texp, texpFac]]):
+        if isinstance(data2, np.ma.MaskedArray):
+            raise TypeError('data2 parameter is a masked array but it must be a plain ndarray. Fill masked values with data2.filled() before.')
+        
+        if not (isinstance(texp, (int, float)) and isinstance(texpFac, (int, float))):
             raise TypeError(f'texp and texpFac parameters have types {type(texp)} and {type(texpFac)} but they must have type int or float.')
             
         if texp <= 0:
@@ -901,9 +972,42 @@ class FilterList:
         if texpFac < 0:
             raise ValueError(f'texpFac has value {texpFac} but it must be positive or null.')
         
-        return np.abs(data2) * texpFac / texp
+        if dtype is not None:
+            data2 = np.asarray(data2, dtype=dtype)
+        
+        # Scalar factor computed once rather than dividing the whole array
+        alpha = texpFac / texp
+        
+        if nonNeg:
+            return data2 * alpha
+        
+        return np.abs(data2) * alpha
     
-    def scale(self, data: ndarray, var: ndarray, norm: ndarray, factor: Union[int, float] = 100) -> Tuple[ndarray]:
+    #: Number of elements above which scale processes the maps by blocks of rows (256 KiB in double precision)
+    _scaleBlockSize = 32768
+    
+    @staticmethod
+    def normInverse(norm: ndarray) -> Tuple[Optional[ndarray], ndarray]:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Compute the mask of the non-null values of a norm map and the inverse of these values. The output can be given to :py:meth:`~FilterList.scale` to avoid computing it again when several maps are scaled with the same norm map.
+        
+        :param norm: normalisation map
+        :type norm: `ndarray`_
+        
+        :returns: mask of the non-null values (:python:`None` if the norm map has no null value) and inverse of the non-null values
+        :rtype: (`ndarray`_ [:python:`bool`], `ndarray`_)
+        '''
+        
+        mask = norm != 0
+        
+        if mask.all():
+            return None, 1/norm
+        
+        return mask, 1/norm[mask]
+    
+    def scale(self, data: ndarray, var: ndarray, norm: ndarray, factor: Union[int, float] = 100, dtype: Optional[Any] = None, inverse: Optional[Tuple[Optional[ndarray], ndarray]] = None) -> Tuple[ndarray]:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
         
@@ -920,26 +1024,88 @@ class FilterList:
         
         :param factor: scale factor which multiplies the output array
         :type factor: :python:`int` or :python:`float`
+        :param dtype: if not :python:`None`, **data**, **var** and **norm** are cast to this type before scaling (e.g. :python:`np.float32` to halve the memory footprint)
+        :param inverse: output of :py:meth:`~FilterList.normInverse` for **norm**. If :python:`None`, it is computed from **norm**.
+        :type inverse: (`ndarray`_ [:python:`bool`], `ndarray`_)
         
         :returns: scaled data and variance maps
         :rtype: (`ndarray`_, `ndarray`_)
         
+        :raises TypeError: if one of **data**, **var** or **norm** is a masked array
         :raises ValueError: if **data** and **norm** do not have the same shapes
         '''
         
+        if isinstance(data, np.ma.MaskedArray) or isinstance(var, np.ma.MaskedArray) or isinstance(norm, np.ma.MaskedArray):
+            raise TypeError('data, var and norm parameters must be plain ndarrays and not masked arrays. Fill masked values with the filled() method before.')
+        
         if norm.shape != data.shape:
             raise ValueError(f'Incompatible norm and data shapes. norm map has shape {norm.shape} but data map has shape {self.data.shape}.')
         
+        if dtype is not None:
+            data      = np.asarray(data, dtype=dtype)
+            var       = np.asarray(var,  dtype=dtype)
+            norm      = np.asarray(norm, dtype=dtype)
+        
+        # Store scale factor for easy access
+        self.scaleFac = factor
+        
+        if inverse is None:
+            inverse   = self.normInverse(norm)
+            
+        mask, normInv = inverse
+        
+        # With a unit factor the inverse can be used directly (it must not be modified in place since it may be shared between calls)
+        if factor == 1:
+            inv       = normInv
+            
+            if mask is None:
+                v     = var*inv
+                v    *= inv
+                return data*inv, v
+            
+            d         = deepcopy(data)
+            v         = deepcopy(var)
+            
+            d[mask]  *= inv
+            v[mask]  *= inv*inv
+            return d, v
+        
+        # If the norm map has no null value, we can skip the masking (new arrays are created so inputs are not overwritten)
+        if mask is None:
+            
+            # Large maps are scaled by blocks of rows so that the scaling buffer is still in cache when updating the variance map
+            if norm.ndim > 1 and norm.size > self._scaleBlockSize:
+                d     = np.empty(data.shape, dtype=np.result_type(data, normInv))
+                v     = np.empty(var.shape,  dtype=np.result_type(var,  normInv))
+                step  = max(1, self._scaleBlockSize // (norm.size // norm.shape[0]))
+                
+                for i in range(0, norm.shape[0], step):
+                    inv = factor*normInv[i:i+step]
+                    np.multiply(data[i:i+step], inv, out=d[i:i+step])
+                    
+                    # Square in place to reuse the same buffer (variance normalisation is squared)
+                    np.multiply(inv, inv, out=inv)
+                    np.multiply(var[i:i+step],  inv, out=v[i:i+step])
+                    
+                return d, v
+            
+            inv       = factor*normInv
+            d         = data*inv
+            
+            # Square in place to reuse the same buffer (variance normalisation is squared)
+            np.multiply(inv, inv, out=inv)
+            return d, var*inv
+        
         # Deep copies to avoid to overwrite input arrays
         d             = deepcopy(data)
         v             = deepcopy(var)
         
-        mask          = norm != 0
-        d[mask]      *= factor/norm[mask]
-        v[mask]      *= (factor*factor/(norm[mask]*norm[mask])) # Variance normalisation is squared
+        inv           = factor*normInv
+        d[mask]      *= inv
         
-        # Store scale factor for easy access
-        self.scaleFac = factor
+        # Square in place to reuse the same buffer (variance normalisation is squared)
+        np.multiply(inv, inv, out=inv)
+        v[mask]      *= inv
         
         return d, v
         
@@ -956,7 +1122,8 @@ class FilterList:
         
         .. warning::
             
-            This function also recomputes and rewrites the output table used for the SED fitting.
+            This function also rewrites the output table used for the SED fitting. Tables are cached for a given code and set of parameters, and a copy of the cached table is used if the same code and parameters are given again.
+            The cache is cleared when the **filters**, **mask** or **redshift** attributes are set, but not when they are modified in place (e.g. a filter data map or some mask values), so call :py:meth:`~FilterList.clearCache` in that case.
             If you want a table with different parameters you must run :py:meth:`~FilterList.genTable` again, for e.g.
             
             >>> from SED.misc import SEDcode, CleanMethod
@@ -974,9 +1141,37 @@ class FilterList:
             raise TypeError(f'code parameter has type {type(code)} but it must be of type SEDcode.')
         
         self.code = code
+        
+        # Reuse a previously generated table if the same code and parameters were already used
+        try:
+            key   = (code, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            key   = None
+        
+        # Copies are stored and handed out so that modifying the table in place does not alter the cached one
+        if key is not None and key in self._tableCache:
+            table, meanMap, self.scaleFac = self._tableCache[key]
+            self.table                    = table.copy()
+            self.meanMap                  = deepcopy(meanMap)
+            return
             
         # Update output table with default parameters
         self.genTable(*args, **kwargs)
+        
+        if key is not None:
+            self._tableCache[key] = (self.table.copy(), deepcopy(self.meanMap), self.scaleFac)
+        
+        return
+    
+    def clearCache(self, *args, **kwargs) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Clear the tables cached by :py:meth:`~FilterList.setCode`. This must be called if the filters data or the mask are modified in place after the filter list was created.
+        '''
+        
+        self._tableCache.clear()
         return
     
     
@@ -984,8 +1179,20 @@ class FilterList:
     #      Partial methods      #
     #############################
     
-    #: Set Cigale as fitting code
-    setCigale  = partialmethod(setCode, SEDcode.CIGALE)
+    def setCigale(self, *args, **kwargs) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Set Cigale as fitting code. Additional parameters are passed to :py:meth:`~FilterList.setCode`.
+        '''
+        
+        return self.setCode(SEDcode.CIGALE, *args, **kwargs)
     
-    #: Set LePhare as fitting code
-    setLePhare = partialmethod(setCode, SEDcode.LEPHARE)
\ No newline at end of file
+    def setLePhare(self, *args, **kwargs) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Set LePhare as fitting code. Additional parameters are passed to :py:meth:`~FilterList.setCode`.
+        '''
+        
+        return self.setCode(SEDcode.LEPHARE, *args, **kwargs)
\ No newline at end of file
@@ -9,40 +9,194 @@ Modules which can be used with Cigale.
 from   abc           import ABC, abstractmethod
 from   .enum         import IMF
 from   .properties   import BoolProperty, PathProperty, StrProperty, EnumProperty, ListIntProperty, ListFloatProperty
-from   typing        import List, Any
+from   typing        import List, Any, Callable
+from   string        import Formatter
+from   textwrap      import dedent
+from   functools     import lru_cache, partial
+import re
 
-##########################################
-#        Star Formation Histories        #
-##########################################
+#########################
+#        Helpers        #
+#########################
+
+#: Each template split into its field names, the literal text before each field and the literal text after the last field. Computed the first time a template is used.
+_TEMPLATE_PARTS = {}
 
-class SFHmodule(ABC):
+def _splitTemplate(template: str) -> tuple:
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
     
-    Base class implementing a module to deal with SFH models.
+    Split a template into its fields and the static text around them. The result is cached so that each template is only parsed once.
     
-    :param name: identifier for the class
+    :param str template: template to split
+    
+    :returns: field names, literal text before each field and literal text after the last field
+    :rtype: (:python:`tuple[str]`, :python:`tuple[str]`, :python:`str`)
+    '''
+    
+    parts = _TEMPLATE_PARTS.get(template)
+    
+    if parts is None:
+        parsed = list(Formatter().parse(template))
+        fields = tuple(field for _, field, _, _ in parsed if field is not None)
+        heads  = tuple(text  for text, field, _, _ in parsed if field is not None)
+        tail   = parsed[-1][0] if parsed and parsed[-1][1] is None else ''
+        
+        parts                     = (fields, heads, tail)
+        _TEMPLATE_PARTS[template] = parts
+        
+    return parts
+
+def _formatTemplate(module: Any) -> str:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    Fill the template of a module with its properties.
+    
+    The static text of the template is only parsed once and the text is generated with a single join over the static parts and the properties string representations.
+    
+    The generated text is cached on the module along with the properties and their values. It is reused as long as none of the properties has been replaced or set to a new value.
+    
+    .. note::
+        
+        Values modified in place (e.g. :python:`module.age.value.append(100)`) bypass the properties checks and are not detected. Use the :python:`set` method of the properties instead (it stores a copy of the new value, so the modified list can be set again), or call :py:meth:`CIGALEmodule.clearCache` afterwards.
+    
+    :param CIGALEmodule module: module to format
+    
+    :returns: the filled template
+    :rtype: :python:`str`
+    '''
+    
+    fields, heads, tail = _splitTemplate(module._TEMPLATE)
+        
+    props               = tuple(getattr(module, field) for field in fields)
+    state               = props + tuple(prop.value for prop in props)
+    cache               = module._strCache
+    
+    if cache is not None and all(i is j for i, j in zip(cache[0], state)):
+        return cache[1]
+    
+    text                = ''.join([piece for pair in zip(heads, map(str, props)) for piece in pair]) + tail
+    module._strCache    = (state, text)
+    return text
+
+@lru_cache(maxsize=None)
+def _notIn(accepted: frozenset, decimals: int = 4) -> Callable[[List[Any]], bool]:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    Build a test function which returns True if one of the values is not in the set of accepted values. Test functions are built once per set of accepted values.
+    
+    Values which are not exactly in the set are compared once rounded to **decimals** decimals, so that a value such as 2.50000001 is accepted for 2.5. This is the policy used by all the checks against a set of accepted values, and **decimals** must be larger than the number of decimals of the accepted values.
+    
+    :param frozenset accepted: accepted values
     
     **Keyword arguments**
     
-    :param normalise: whether to normalise the SFH to produce one solar mass
-    :type normalise: :python:`bool`
+    :param decimals: number of decimals used to compare values which are not exactly in the set
+    :type decimals: :python:`int`
+    
+    :returns: test function to pass to the properties
+    :rtype: :python:`Callable[[list], bool]`
     '''
     
-    def __init__(self, name: Any, normalise: bool = True) -> None:
+    scale = 10**decimals
+    keys  = frozenset(round(i*scale) for i in accepted)
+    
+    # A partial of a module-level function (rather than a closure) so that the properties using it can be pickled
+    return partial(_notInTest, accepted, keys, scale)
+
+def _notInTest(accepted: frozenset, keys: frozenset, scale: int, value: List[Any]) -> bool:
+    r'''Test function built by :py:func:`_notIn`.'''
+    
+    # Exact values are checked with a single hashed subset test, rounding is only needed otherwise
+    if accepted.issuperset(value):
+        return False
+    
+    return not keys.issuperset(round(i*scale) for i in value)
+
+@lru_cache(maxsize=None)
+def _notInMsg(name: str, accepted: frozenset) -> str:
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    Build the error message used when one of the values of a property is not in the set of accepted values. Messages are built once per property name and set of accepted values.
+    
+    :param str name: name of the property
+    :param frozenset accepted: accepted values
+    
+    :returns: error message to pass to the properties
+    :rtype: :python:`str`
+    '''
+    
+    return f'One on the {name} values is not accepted. Accepted values must be in the list {sorted(accepted)}.'
+
+#############################
+#        Base module        #
+#############################
+
+class CIGALEmodule(ABC):
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    Base class shared by Cigale modules. Subclasses only need to define their properties, a **_TEMPLATE** class attribute used to make Cigale parameter files and a **spec** class attribute used to make the .spec file.
+    
+    :param name: identifier for the class
+    '''
+    
+    __slots__ = ('name', '_strCache')
+    
+    #: Template used to make Cigale parameter files. Fields are replaced by the properties with the same name.
+    _TEMPLATE      = ''
+    
+    #: Text appended to the template of the subclasses once it is dedented (it must therefore be given without indentation)
+    _TEMPLATE_TAIL = ''
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        r'''
+        Remove the common indentation of the template and append **_TEMPLATE_TAIL** once, when the subclass is created, and check that every field of the template is a property of the subclass.
+        
+        :raises TypeError: if one of the template fields is not in the **__slots__** of the subclass or of its parents
+        '''
+        
+        super().__init_subclass__(**kwargs)
+        
+        if '_TEMPLATE' in cls.__dict__:
+            cls._TEMPLATE = dedent(cls._TEMPLATE) + cls._TEMPLATE_TAIL
+            
+            slots         = {slot for klass in cls.__mro__ for slot in getattr(klass, '__slots__', ())}
+            missing       = [field for field in _splitTemplate(cls._TEMPLATE)[0] if field not in slots]
+            
+            if missing:
+                raise TypeError(f'template of {cls.__name__} has fields {missing} which are not in the __slots__ of the class or of its parents.')
+        
+    def __init__(self, name: Any) -> None:
         r'''Init method.'''
         
         self.name      = name
-        self.normalise = BoolProperty(normalise)
+        self._strCache = None
         
-    @abstractmethod
     def __str__(self, *args, **kwargs) -> str:
         r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@ilam.fr>
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
         
         Implement a string representation of the class used to make Cigale parameter files.
         '''
         
+        return _formatTemplate(self)
+    
+    def clearCache(self, *args, **kwargs) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Clear the string representations cached by :py:meth:`__str__` and by the properties. This must be called if the value of one of the properties is modified in place.
+        '''
+        
+        self._strCache = None
+        
+        for field in _splitTemplate(self._TEMPLATE)[0]:
+            getattr(self, field).clearCache()
+                
         return
     
     @property
@@ -51,11 +205,41 @@ class SFHmodule(ABC):
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
         
-        Implement a string representation for the .spec file of Cigale parameters.
+        Implement a string representation for the .spec file of Cigale parameters. Subclasses override it with a constant class attribute.
         '''
         
         return
     
+##########################################
+#        Star Formation Histories        #
+##########################################
+
+class SFHmodule(CIGALEmodule):
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    Base class implementing a module to deal with SFH models.
+    
+    :param name: identifier for the class
+    
+    **Keyword arguments**
+    
+    :param normalise: whether to normalise the SFH to produce one solar mass
+    :type normalise: :python:`bool`
+    '''
+    
+    __slots__ = ('normalise',)
+    
+    #: End of the template shared by the SFH modules which normalise the SFH to one solar mass
+    _TEMPLATE_TAIL = ('  # Normalise the SFH to produce one solar mass.\n'
+                      '  normalise = {normalise}\n')
+    
+    def __init__(self, name: Any, normalise: bool = True) -> None:
+        r'''Init method.'''
+        
+        super().__init__(name)
+        self.normalise = BoolProperty(normalise)
+    
 class SFH2EXPmodule(SFHmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -86,6 +270,38 @@ class SFH2EXPmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
+    __slots__ = ('tau_main', 'tau_burst', 'f_burst', 'age', 'burst_age', 'sfr_0')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[sfh2exp]]
+          # e-folding time of the main stellar population model in Myr.
+          tau_main = {tau_main}
+          # e-folding time of the late starburst population model in Myr.
+          tau_burst = {tau_burst}
+          # Mass fraction of the late burst population.
+          f_burst = {f_burst}
+          # Age of the main stellar population in the galaxy in Myr. The precision
+          # is 1 Myr.
+          age = {age}
+          # Age of the late burst in Myr. The precision is 1 Myr.
+          burst_age = {burst_age}
+          # Value of SFR at t = 0 in M_sun/yr.
+          sfr_0 = {sfr_0}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[sfh2exp]]
+          tau_main = cigale_list()
+          tau_burst = cigale_list()
+          f_burst = cigale_list(minvalue=0., maxvalue=0.9999)
+          age = cigale_list(dtype=int, minvalue=0.)
+          burst_age = cigale_list(dtype=int, minvalue=1.)
+          sfr_0 = cigale_list(minvalue=0.)
+          normalise = boolean()\
+        '''
+    
     def __init__(self, 
                  tau_main:  List[int]   = [6000], 
                  tau_burst: List[int]   = [50],
@@ -107,55 +323,6 @@ class SFH2EXPmodule(SFHmodule):
         self.burst_age = ListIntProperty(  burst_age, minBound=0)
         self.sfr_0     = ListFloatProperty(sfr_0,     minBound=0.0)
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[sfh2exp]]
-          # e-folding time of the main stellar population model in Myr.
-          tau_main = {self.tau_main}
-          # e-folding time of the late starburst population model in Myr.
-          tau_burst = {self.tau_burst}
-          # Mass fraction of the late burst population.
-          f_burst = {self.f_burst}
-          # Age of the main stellar population in the galaxy in Myr. The precision
-          # is 1 Myr.
-          age = {self.age}
-          # Age of the late burst in Myr. The precision is 1 Myr.
-          burst_age = {self.burst_age}
-          # Value of SFR at t = 0 in M_sun/yr.
-          sfr_0 = {self.sfr_0}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[sfh2exp]]
-          tau_main = cigale_list()
-          tau_burst = cigale_list()
-          f_burst = cigale_list(minvalue=0., maxvalue=0.9999)
-          age = cigale_list(dtype=int, minvalue=0.)
-          burst_age = cigale_list(dtype=int, minvalue=1.)
-          sfr_0 = cigale_list(minvalue=0.)
-          normalise = boolean()\
-        '''
-        
-        return text
-    
     
 class SFHDELAYEDmodule(SFHmodule):
     r'''
@@ -193,65 +360,29 @@ class SFHDELAYEDmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
-    def __init__(self, 
-                 tau_main:  List[int]   = [2000], 
-                 age_main:  List[int]   = [5000],
-                 tau_burst: List[int]   = [50],
-                 age_burst: List[int]   = [20], 
-                 f_burst:   List[float] = [0.0],  
-                 sfr_A:     List[float] = [1.0],
-                 normalise: bool        = True
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('sfhdelayed', normalise=normalise)
-        
-        self.tau_main  = ListIntProperty(  tau_main,  minBound=0)
-        self.age_main  = ListIntProperty(  age_main,  minBound=0)
-        self.tau_burst = ListIntProperty(  tau_burst, minBound=0)
-        self.age_burst = ListIntProperty(  age_burst, minBound=0)
-        self.f_burst   = ListFloatProperty(f_burst,   minBound=0.0, maxBound=0.9999)
-        self.sfr_A     = ListFloatProperty(sfr_A,     minBound=0.0)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('tau_main', 'age_main', 'tau_burst', 'age_burst', 'f_burst', 'sfr_A')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[sfhdelayed]]
           # e-folding time of the main stellar population model in Myr.
-          tau_main = {self.tau_main}
+          tau_main = {tau_main}
           # Age of the main stellar population in the galaxy in Myr. The precision
           # is 1 Myr.
-          age_main = {self.age_main}
+          age_main = {age_main}
           # e-folding time of the late starburst population model in Myr.
-          tau_burst = {self.tau_burst}
+          tau_burst = {tau_burst}
           # Age of the late burst in Myr. The precision is 1 Myr.
-          age_burst = {self.age_burst}
+          age_burst = {age_burst}
           # Mass fraction of the late burst population.
-          f_burst = {self.f_burst}
+          f_burst = {f_burst}
           # Multiplicative factor controlling the SFR if normalise is False. For
           # instance without any burst: SFR(t)=sfr_A×t×exp(-t/τ)/τ²
-          sfr_A = {self.sfr_A}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
+          sfr_A = {sfr_A}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[sfhdelayed]]
           tau_main = cigale_list()
           age_main = cigale_list(dtype=int, minvalue=0.)
@@ -261,9 +392,28 @@ class SFHDELAYEDmodule(SFHmodule):
           sfr_A = cigale_list(minvalue=0.)
           normalise = boolean()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 tau_main:  List[int]   = [2000], 
+                 age_main:  List[int]   = [5000],
+                 tau_burst: List[int]   = [50],
+                 age_burst: List[int]   = [20], 
+                 f_burst:   List[float] = [0.0],  
+                 sfr_A:     List[float] = [1.0],
+                 normalise: bool        = True
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('sfhdelayed', normalise=normalise)
+        
+        self.tau_main  = ListIntProperty(  tau_main,  minBound=0)
+        self.age_main  = ListIntProperty(  age_main,  minBound=0)
+        self.tau_burst = ListIntProperty(  tau_burst, minBound=0)
+        self.age_burst = ListIntProperty(  age_burst, minBound=0)
+        self.f_burst   = ListFloatProperty(f_burst,   minBound=0.0, maxBound=0.9999)
+        self.sfr_A     = ListFloatProperty(sfr_A,     minBound=0.0)
+        
     
 class SFHDELAYEDBQmodule(SFHmodule):
     r'''
@@ -300,6 +450,36 @@ class SFHDELAYEDBQmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
+    __slots__ = ('tau_main', 'age_main', 'age_bq', 'r_sfr', 'sfr_A')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[sfhdelayedbq]]
+          # e-folding time of the main stellar population model in Myr.
+          tau_main = {tau_main}
+          # Age of the main stellar population in the galaxy in Myr. The precision
+          # is 1 Myr.
+          age_main = {age_main}
+          # Age of the burst/quench episode. The precision is 1 Myr.
+          age_bq = {age_bq}
+          # Ratio of the SFR after/before age_bq.
+          r_sfr = {r_sfr}
+          # Multiplicative factor controlling the SFR if normalise is False. For
+          # instance without any burst/quench: SFR(t)=sfr_A×t×exp(-t/τ)/τ²
+          sfr_A = {sfr_A}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[sfhdelayedbq]]
+          tau_main = cigale_list()
+          age_main = cigale_list(dtype=int, minvalue=0.)
+          age_bq = cigale_list(dtype=int)
+          r_sfr = cigale_list(minvalue=0.)
+          sfr_A = cigale_list(minvalue=0.)
+          normalise = boolean()\
+        '''
+    
     def __init__(self, 
                  tau_main:  List[int]   = [2000], 
                  age_main:  List[int]   = [5000],
@@ -319,61 +499,14 @@ class SFHDELAYEDBQmodule(SFHmodule):
         self.r_sfr     = ListFloatProperty(r_sfr,     minBound=0.0)
         self.sfr_A     = ListFloatProperty(sfr_A,     minBound=0.0)
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[sfhdelayedbq]]
-          # e-folding time of the main stellar population model in Myr.
-          tau_main = {self.tau_main}
-          # Age of the main stellar population in the galaxy in Myr. The precision
-          # is 1 Myr.
-          age_main = {self.age_main}
-          # Age of the burst/quench episode. The precision is 1 Myr.
-          age_bq = {self.age_bq}
-          # Ratio of the SFR after/before age_bq.
-          r_sfr = {self.r_sfr}
-          # Multiplicative factor controlling the SFR if normalise is False. For
-          # instance without any burst/quench: SFR(t)=sfr_A×t×exp(-t/τ)/τ²
-          sfr_A = {self.sfr_A}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}    
-        '''
-        
-        return text
-
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[sfhdelayedbq]]
-          tau_main = cigale_list()
-          age_main = cigale_list(dtype=int, minvalue=0.)
-          age_bq = cigale_list(dtype=int)
-          r_sfr = cigale_list(minvalue=0.)
-          sfr_A = cigale_list(minvalue=0.)
-          normalise = boolean()\
-        '''
-        
-        return text
-    
-    
-class SFHFROMFILEmodule(SFHmodule):
-    r'''
-    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-    
-    Class implementing a module for a SFH read from a FITS or VOtable file.
-    
-    .. note::
+    
+class SFHFROMFILEmodule(SFHmodule):
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    Class implementing a module for a SFH read from a FITS or VOtable file.
+    
+    .. note::
         
         The first column of the input file must be the time in :math:`\rm Myr`, starting from :math:`0\,\rm Myr` with a step of :math:`1\,\rm Myr`. Other columns contain the SFHs in :math:`\rm M_{\odot}\,yr^{-1}`.
     
@@ -389,63 +522,51 @@ class SFHFROMFILEmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
-    def __init__(self, 
-                 filename:   str       = '',
-                 sfr_column: List[int] = [1],
-                 age:        List[int] = [1000],
-                 normalise:  bool      = True
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('sfrfromfile', normalise=normalise)
-        
-        self.filename   = PathProperty(filename)
-        self.sfr_column = ListIntProperty(sfr_column)
-        self.age        = ListIntProperty(age, minBound=0)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('filename', 'sfr_column', 'age')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[sfhfromfile]]
           # Name of the file containing the SFH. The first column must be the time
           # in Myr, starting from 0 with a step of 1 Myr. The other columns must
           # contain the SFR in Msun/yr.[Msun/yr].
-          filename = {self.filename}
+          filename = {filename}
           # List of column indices of the SFR. The first SFR column has the index
           # 1.
-          sfr_column = {self.sfr_column}
+          sfr_column = {sfr_column}
           # Age in Myr at which the SFH will be looked at.
-          age = {self.age}
+          age = {age}
           # Normalise the SFH to one solar mass produced at the given age.
-          normalise = {self.normalise}
+          normalise = {normalise}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: The normalise section is already in the template, with its own wording
+    _TEMPLATE_TAIL = ''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[sfhfromfile]]
           filename = string()
           sfr_column = cigale_list(dtype=int)
           age = cigale_list(dtype=int, minvalue=0.)
           normalise = boolean()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 filename:   str       = '',
+                 sfr_column: List[int] = [1],
+                 age:        List[int] = [1000],
+                 normalise:  bool      = True
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('sfrfromfile', normalise=normalise)
+        
+        self.filename   = PathProperty(filename)
+        self.sfr_column = ListIntProperty(sfr_column)
+        self.age        = ListIntProperty(age, minBound=0)
+        
     
 class SFHPERIODICmodule(SFHmodule):
     r'''
@@ -477,64 +598,30 @@ class SFHPERIODICmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
-    def __init__(self, 
-                 type_bursts:  List[int]   = [0],
-                 delta_bursts: List[int]   = [50],
-                 tau_bursts:   List[int]   = [20],
-                 age:          List[int]   = [1000],
-                 sfr_A:        List[float] = [1.0],
-                 normalise:    bool        = True
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('sfhperiodic', normalise=normalise)
-        
-        self.type_bursts  = ListIntProperty(  type_bursts,  minBound=0, maxBound=2)
-        self.delta_bursts = ListIntProperty(  delta_bursts, minBound=0)
-        self.tau_bursts   = ListIntProperty(  tau_bursts,   minBound=0)
-        self.age          = ListIntProperty(  age,          minBound=0)
-        self.sfr_A        = ListFloatProperty(sfr_A,        minBound=0.0)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('type_bursts', 'delta_bursts', 'tau_bursts', 'age', 'sfr_A')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[sfhperiodic]]
           # Type of the individual star formation episodes. 0: exponential, 1:
           # delayed, 2: rectangle.
-          type_bursts = {self.type_bursts}
+          type_bursts = {type_bursts}
           # Elapsed time between the beginning of each burst in Myr. The precision
           # is 1 Myr.
-          delta_bursts = {self.delta_bursts}
+          delta_bursts = {delta_bursts}
           # Duration (rectangle) or e-folding time of all short events in Myr. The
           # precision is 1 Myr.
-          tau_bursts = {self.tau_bursts}
+          tau_bursts = {tau_bursts}
           # Age of the main stellar population in the galaxy in Myr. The precision
           # is 1 Myr.
-          age = {self.age}
+          age = {age}
           # Multiplicative factor controlling the amplitude of SFR (valid for each
           # event).
-          sfr_A = {self.sfr_A}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
+          sfr_A = {sfr_A}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[sfhperiodic]]
           type_bursts = cigale_list(dtype=int, options=0. & 1. & 2.)
           delta_bursts = cigale_list(dtype=int, minvalue=0.)
@@ -543,9 +630,26 @@ class SFHPERIODICmodule(SFHmodule):
           sfr_A = cigale_list(minvalue=0.)
           normalise = boolean()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 type_bursts:  List[int]   = [0],
+                 delta_bursts: List[int]   = [50],
+                 tau_bursts:   List[int]   = [20],
+                 age:          List[int]   = [1000],
+                 sfr_A:        List[float] = [1.0],
+                 normalise:    bool        = True
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('sfhperiodic', normalise=normalise)
+        
+        self.type_bursts  = ListIntProperty(  type_bursts,  minBound=0, maxBound=2)
+        self.delta_bursts = ListIntProperty(  delta_bursts, minBound=0)
+        self.tau_bursts   = ListIntProperty(  tau_bursts,   minBound=0)
+        self.age          = ListIntProperty(  age,          minBound=0)
+        self.sfr_A        = ListFloatProperty(sfr_A,        minBound=0.0)
+        
 class SFH_BUATmodule(SFHmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -572,6 +676,26 @@ class SFH_BUATmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
+    __slots__ = ('velocity', 'age')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[sfh_buat08]]
+          # Rotational velocity of the galaxy in km/s. Must be between 40 and 360
+          # (included).
+          velocity = {velocity}
+          # Age of the oldest stars in the galaxy. The precision is 1 Myr.
+          age = {age}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[sfh_buat08]]
+          velocity = cigale_list(minvalue=40., maxvalue=360.)
+          age = cigale_list(dtype=int, minvalue=0.)
+          normalise = boolean()\
+        '''
+    
     def __init__(self, 
                  velocity  : List[float] = [200.0],
                  age       : List[int]   = [5000],
@@ -585,43 +709,6 @@ class SFH_BUATmodule(SFHmodule):
         self.velocity = ListFloatProperty(velocity, minBound=40.0, maxBound=360.0)
         self.age      = ListIntProperty(  age,      minBound=0)
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[sfh_buat08]]
-          # Rotational velocity of the galaxy in km/s. Must be between 40 and 360
-          # (included).
-          velocity = {self.velocity}
-          # Age of the oldest stars in the galaxy. The precision is 1 Myr.
-          age = {self.age}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[sfh_buat08]]
-          velocity = cigale_list(minvalue=40., maxvalue=360.)
-          age = cigale_list(dtype=int, minvalue=0.)
-          normalise = boolean()\
-        '''
-        
-        return text
-    
 class SFH_QUENCHING_SMOOTHmodule(SFHmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -651,57 +738,40 @@ class SFH_QUENCHING_SMOOTHmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
-    def __init__(self, 
-                 quenching_time   : List[int]   = [0],
-                 quenching_factor : List[float] = [0.0],
-                 normalise        : bool        = True
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('sfh_quenching_smooth', normalise=normalise)
-        
-        self.quenching_time   = ListIntProperty(  quenching_time,   minBound=0)
-        self.quenching_factor = ListFloatProperty(quenching_factor, minBound=0.0, maxBound=1.0)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('quenching_time', 'quenching_factor')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[sfh_quenching_smooth]]
           # Look-back time when the quenching starts in Myr.
-          quenching_time = {self.quenching_time}
+          quenching_time = {quenching_time}
           # Quenching factor applied to the SFH. After the quenching time, the SFR
           # is multiplied by 1 - quenching factor and made constant. The factor
           # must be between 0 (no quenching) and 1 (no more star formation).
-          quenching_factor = {self.quenching_factor}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
+          quenching_factor = {quenching_factor}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[sfh_quenching_smooth]]
           quenching_time = cigale_list(dtype=int, minvalue=0.)
           quenching_factor = cigale_list(minvalue=0., maxvalue=1.)
           normalise = boolean()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 quenching_time   : List[int]   = [0],
+                 quenching_factor : List[float] = [0.0],
+                 normalise        : bool        = True
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('sfh_quenching_smooth', normalise=normalise)
+        
+        self.quenching_time   = ListIntProperty(  quenching_time,   minBound=0)
+        self.quenching_factor = ListFloatProperty(quenching_factor, minBound=0.0, maxBound=1.0)
+        
 class SFH_QUENCHING_TRUNKmodule(SFHmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -728,62 +798,55 @@ class SFH_QUENCHING_TRUNKmodule(SFHmodule):
     :type normalise: :python:`bool`
     '''
     
-    def __init__(self, 
-                 quenching_age    : List[int]   = [0],
-                 quenching_factor : List[float] = [0.0],
-                 normalise        : bool        = True
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('sfh_quenching_smooth', normalise=normalise)
-        
-        self.quenching_age    = ListIntProperty(  quenching_age,    minBound=0)
-        self.quenching_factor = ListFloatProperty(quenching_factor, minBound=0.0, maxBound=1.0)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('quenching_age', 'quenching_factor')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[sfh_quenching_trunk]]
           # Look-back time when the quenching happens in Myr.
-          quenching_age = {self.quenching_age}
+          quenching_age = {quenching_age}
           # Quenching factor applied to the SFH. After the quenching time, the SFR
           # is multiplied by 1 - quenching factor and made constant. The factor
           # must be between 0 (no quenching) and 1 (no more star formation).
-          quenching_factor = {self.quenching_factor}
-          # Normalise the SFH to produce one solar mass.
-          normalise = {self.normalise}
+          quenching_factor = {quenching_factor}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[sfh_quenching_trunk]]
           quenching_age = cigale_list(dtype=int, minvalue=0.)
           quenching_factor = cigale_list(minvalue=0., maxvalue=1.)
           normalise = boolean()\
         '''
-        
-        return text
     
-############################################
-#        Single Stellar Populations        #
-############################################
-
-class SSPmodule(ABC):
+    def __init__(self, 
+                 quenching_age    : List[int]   = [0],
+                 quenching_factor : List[float] = [0.0],
+                 normalise        : bool        = True
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('sfh_quenching_smooth', normalise=normalise)
+        
+        self.quenching_age    = ListIntProperty(  quenching_age,    minBound=0)
+        self.quenching_factor = ListFloatProperty(quenching_factor, minBound=0.0, maxBound=1.0)
+        
+############################################
+#        Single Stellar Populations        #
+############################################
+
+#: Accepted metallicities for the bc03 module
+_BC03_METALLICITIES  = frozenset((0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05))
+
+#: Accepted metallicities for the m2005 module
+_M2005_METALLICITIES = frozenset((0.001, 0.01, 0.02, 0.04))
+
+#: Test functions for the metallicities (metallicities are given with up to 4 decimals, so they are compared with 8 decimals)
+_checkBC03Metallicity  = _notIn(_BC03_METALLICITIES,  decimals=8)
+_checkM2005Metallicity = _notIn(_M2005_METALLICITIES, decimals=8)
+
+class SSPmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
     
@@ -799,6 +862,8 @@ class SSPmodule(ABC):
     :type separation_age: :python:`list[int]`
     '''
     
+    __slots__ = ('imf', 'separation_age')
+    
     def __init__(self, 
                  name           : Any,
                  imf            : IMF       = IMF.SALPETER,
@@ -807,30 +872,9 @@ class SSPmodule(ABC):
         
         r'''Init method.'''
         
-        self.name           = name
+        super().__init__(name)
         self.imf            = EnumProperty(imf)
         self.separation_age = ListIntProperty(separation_age, minBound=0)
-        
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        return
-    
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        return
     
 class BC03module(SSPmodule):
     r'''
@@ -848,59 +892,44 @@ class BC03module(SSPmodule):
     :type metallicity: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 imf            : IMF         = IMF.SALPETER,
-                 separation_age : List[int]   = [10],
-                 metallicity    : List[float] = [0.02]
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('bc03', imf=imf, separation_age=separation_age)
-        
-        self.metallicity = ListFloatProperty(metallicity, minBound=0.0001, maxBound=0.05, 
-                                             testFunc=lambda value: any((i not in [0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05] for i in value)),
-                                             testMsg='Metallicity for bc03 module must be one of 0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05.')
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('metallicity',)
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[bc03]]
           # Initial mass function: 0 (Salpeter) or 1 (Chabrier).
-          imf = {self.imf}
+          imf = {imf}
           # Metalicity. Possible values are: 0.0001, 0.0004, 0.004, 0.008, 0.02,
           # 0.05.
-          metallicity = {self.metallicity}
+          metallicity = {metallicity}
           # Age [Myr] of the separation between the young and the old star
           # populations. The default value in 10^7 years (10 Myr). Set to 0 not to
           # differentiate ages (only an old population).
-          separation_age = {self.separation_age}
+          separation_age = {separation_age}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[bc03]]
           imf = cigale_list(dtype=int, options=0. & 1.)
           metallicity = cigale_list(options=0.0001 & 0.0004 & 0.004 & 0.008 & 0.02 & 0.05)
           separation_age = cigale_list(dtype=int, minvalue=0)\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 imf            : IMF         = IMF.SALPETER,
+                 separation_age : List[int]   = [10],
+                 metallicity    : List[float] = [0.02]
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('bc03', imf=imf, separation_age=separation_age)
+        
+        self.metallicity = ListFloatProperty(metallicity, minBound=0.0001, maxBound=0.05, 
+                                             testFunc=_checkBC03Metallicity,
+                                             testMsg='Metallicity for bc03 module must be one of 0.0001, 0.0004, 0.004, 0.008, 0.02, 0.05.')
+        
 class M2005module(SSPmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -921,63 +950,54 @@ class M2005module(SSPmodule):
     :type metallicity: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 imf            : IMF         = IMF.SALPETER,
-                 separation_age : List[int]   = [10],
-                 metallicity    : List[float] = [0.02]
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('m2005', imf=imf, separation_age=separation_age)
-        
-        self.metallicity = ListFloatProperty(metallicity, minBound=0.001, maxBound=0.04, 
-                                             testFunc=lambda value: any((i not in [0.001, 0.01, 0.02, 0.04] for i in value)),
-                                             testMsg='Metallicity for bc03 module must be one of 0.001, 0.01, 0.02, 0.04.')
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('metallicity',)
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[m2005]]
           # Initial mass function: 0 (Salpeter) or 1 (Kroupa)
-          imf = {self.imf}
+          imf = {imf}
           # Metallicity. Possible values are: 0.001, 0.01, 0.02, 0.04.
-          metallicity = {self.metallicity}
+          metallicity = {metallicity}
           # Age [Myr] of the separation between the young and the old star
           # populations. The default value in 10^7 years (10 Myr). Set to 0 not to
           # differentiate ages (only an old population).
-          separation_age = {self.separation_age}
+          separation_age = {separation_age}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[m2005]]
           imf = cigale_list(dtype=int, options=0. & 1.)
           metallicity = cigale_list(options=0.001 & 0.01 & 0.02 & 0.04)
           separation_age = cigale_list(dtype=int, minvalue=0.)\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 imf            : IMF         = IMF.SALPETER,
+                 separation_age : List[int]   = [10],
+                 metallicity    : List[float] = [0.02]
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('m2005', imf=imf, separation_age=separation_age)
+        
+        self.metallicity = ListFloatProperty(metallicity, minBound=0.001, maxBound=0.04, 
+                                             testFunc=_checkM2005Metallicity,
+                                             testMsg='Metallicity for m2005 module must be one of 0.001, 0.01, 0.02, 0.04.')
+        
 ##################################
 #        Nebular emission        #
 ##################################
 
-class NEBULARmodule:
+#: Accepted values for logU (steps of 0.1 between -4.0 and -1.0)
+_NEBULAR_LOGU = frozenset(i/10 for i in range(-40, -9, 1))
+
+#: Test function for logU
+_checkNebularLogU = _notIn(_NEBULAR_LOGU)
+
+class NEBULARmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
     
@@ -1001,6 +1021,33 @@ class NEBULARmodule:
     :type include_emission: :python:`bool`
     '''
     
+    __slots__ = ('logU', 'f_esc', 'f_dust', 'lines_width', 'emission')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[nebular]]
+          # Ionisation parameter
+          logU = {logU}
+          # Fraction of Lyman continuum photons escaping the galaxy
+          f_esc = {f_esc}
+          # Fraction of Lyman continuum photons absorbed by dust
+          f_dust = {f_dust}
+          # Line width in km/s
+          lines_width = {lines_width}
+          # Include nebular emission.
+          emission = {emission}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[nebular]]
+          logU = cigale_list(options=-4.0 & -3.9 & -3.8 & -3.7 & -3.6 & -3.5 & -3.4 & -3.3 & -3.2 & -3.1 & -3.0 & -2.9 & -2.8 & -2.7 & -2.6 & -2.5 & -2.4 & -2.3 & -2.2 & -2.1 & -2.0 & -1.9 & -1.8 & -1.7 & -1.6 & -1.5 & -1.4 & -1.3 & -1.2 & -1.1 & -1.0)
+          f_esc = cigale_list(minvalue=0., maxvalue=1.)
+          f_dust = cigale_list(minvalue=0., maxvalue=1.)
+          lines_width = cigale_list(minvalue=0.)
+          emission = boolean()\
+        '''
+    
     def __init__(self, 
                  logU             : List[float] = [-2.0],
                  f_esc            : List[float] = [0.0],
@@ -1011,66 +1058,22 @@ class NEBULARmodule:
         
         r'''Init method.'''
         
-        self.name        = 'nebular'
-        
-        logURange        = [i/10 for i in range(-40, -9, 1)]
+        super().__init__('nebular')
         
         self.logU        = ListFloatProperty(logU, minBound=-4.0, maxBound=-1.0,
-                                             testFunc=lambda value: any((i not in logURange for i in value)),
-                                             testMsg=f'One on the logU values is not accepted. Accepted values must be in the list {logURange}')
+                                             testFunc=_checkNebularLogU,
+                                             testMsg=_notInMsg('logU', _NEBULAR_LOGU))
         
         self.f_esc       = ListFloatProperty(f_esc,       minBound=0, maxBound=1)
         self.f_dust      = ListFloatProperty(f_dust,      minBound=0, maxBound=1)
         self.lines_width = ListFloatProperty(lines_width, minBound=0)
         self.emission    = BoolProperty(include_emission)
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[nebular]]
-          # Ionisation parameter
-          logU = {self.logU}
-          # Fraction of Lyman continuum photons escaping the galaxy
-          f_esc = {self.f_esc}
-          # Fraction of Lyman continuum photons absorbed by dust
-          f_dust = {self.f_dust}
-          # Line width in km/s
-          lines_width = {self.lines_width}
-          # Include nebular emission.
-          emission = {self.emission}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[nebular]]
-          logU = cigale_list(options=-4.0 & -3.9 & -3.8 & -3.7 & -3.6 & -3.5 & -3.4 & -3.3 & -3.2 & -3.1 & -3.0 & -2.9 & -2.8 & -2.7 & -2.6 & -2.5 & -2.4 & -2.3 & -2.2 & -2.1 & -2.0 & -1.9 & -1.8 & -1.7 & -1.6 & -1.5 & -1.4 & -1.3 & -1.2 & -1.1 & -1.0)
-          f_esc = cigale_list(minvalue=0., maxvalue=1.)
-          f_dust = cigale_list(minvalue=0., maxvalue=1.)
-          lines_width = cigale_list(minvalue=0.)
-          emission = boolean()\
-        '''
-        
-        return text
-    
 ##################################
 #        Dust attenuation        #
 ##################################
 
-class ATTENUATIONmodule(ABC):
+class ATTENUATIONmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
     
@@ -1084,32 +1087,13 @@ class ATTENUATIONmodule(ABC):
     :type filters: :python:`str`
     '''
     
+    __slots__ = ('filters',)
+    
     def __init__(self, name: Any, filters: str = 'V_B90 & FUV') -> None:
         r'''Init method.'''
         
-        self.name    = name
+        super().__init__(name)
         self.filters = StrProperty(filters)
-        
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        return
-    
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        return
     
 class DUSTATT_POWERLAWmodule(ATTENUATIONmodule):
     r'''
@@ -1135,67 +1119,32 @@ class DUSTATT_POWERLAWmodule(ATTENUATIONmodule):
     :type powerlaw_slope: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 filters            : str         = 'V_B90 & FUV',
-                 Av_young           : List[float] = [1.0],
-                 Av_old_factor      : List[float] = [0.44],
-                 uv_bump_wavelength : List[float] = [217.5],
-                 uv_bump_width      : List[float] = [35.0],
-                 uv_bump_amplitude  : List[float] = [0.0],
-                 powerlaw_slope     : List[float] = [-0.7]
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('dustatt_powerlaw', filters=filters)
-        
-        self.filters            = StrProperty(filters)
-        self.Av_young           = ListFloatProperty(Av_young,           minBound=0.0)
-        self.Av_old_factor      = ListFloatProperty(Av_old_factor,      minBound=0.0, maxBound=1.0)
-        self.uv_bump_wavelength = ListFloatProperty(uv_bump_wavelength, minBound=0.0)
-        self.uv_bump_width      = ListFloatProperty(uv_bump_width,      minBound=0.0)
-        self.uv_bump_amplitude  = ListFloatProperty(uv_bump_amplitude,  minBound=0.0)
-        self.powerlaw_slope     = ListFloatProperty(powerlaw_slope)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('Av_young', 'Av_old_factor', 'uv_bump_wavelength', 'uv_bump_width', 'uv_bump_amplitude', 'powerlaw_slope')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[dustatt_powerlaw]]
           # V-band attenuation of the young population.
-          Av_young = {self.Av_young}
+          Av_young = {Av_young}
           # Reduction factor for the V-band attenuation of the old population
           # compared to the young one (<1).
-          Av_old_factor = {self.Av_old_factor}
+          Av_old_factor = {Av_old_factor}
           # Central wavelength of the UV bump in nm.
-          uv_bump_wavelength = {self.uv_bump_wavelength}
+          uv_bump_wavelength = {uv_bump_wavelength}
           # Width (FWHM) of the UV bump in nm.
-          uv_bump_width = {self.uv_bump_width}
+          uv_bump_width = {uv_bump_width}
           # Amplitude of the UV bump. For the Milky Way: 0.75
-          uv_bump_amplitude = {self.uv_bump_amplitude}
+          uv_bump_amplitude = {uv_bump_amplitude}
           # Slope delta of the power law continuum.
-          powerlaw_slope = {self.powerlaw_slope}
+          powerlaw_slope = {powerlaw_slope}
           # Filters for which the attenuation will be computed and added to the
           # SED information dictionary. You can give several filter names
           # separated by a & (don't use commas).
-          filters = {self.filters}
+          filters = {filters}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[dustatt_powerlaw]]
           Av_young = cigale_list(minvalue=0.)
           Av_old_factor = cigale_list(minvalue=0., maxvalue=1.)
@@ -1205,81 +1154,69 @@ class DUSTATT_POWERLAWmodule(ATTENUATIONmodule):
           powerlaw_slope = cigale_list()
           filters = string()\
         '''
-        
-        return text
-    
-class DUSTATT_2POWERLAWSmodule(ATTENUATIONmodule):
-    r'''
-    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-    
-    Class implementing a double powerlaw attenuation law module: a birth cloud power law applied only to the young star population and an ISM power law applied to both the young and the old stellar populations.
-    
-    **Keyword arguments**
-    
-    :param filters: filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).
-    :type filters: :python:`str`
-    :param Av_BC: V-band attenuation in the birth clouds. Minimum is 0.
-    :type Av_BC: :python:`list[float]`
-    :param slope_BC: power law slope of the attenuation in the birth clouds
-    :type slope_BC: :python:`list[float]`
-    :param BC_to_ISM_factor: Av ISM / Av BC. Must be between 0 and 1.
-    :type BC_to_ISM_factor: :python:`list[float]`
-    :param slope_ISM: power law slope of the attenuation in the ISM
-    :type slope_ISM: :python:`list[float]`
-    '''
     
     def __init__(self, 
-                 filters          : str         = 'V_B90 & FUV',
-                 Av_BC            : List[float] = [1.0],
-                 slope_BC         : List[float] = [-1.3],
-                 BC_to_ISM_factor : List[float] = [0.44],
-                 slope_ISM        : List[float] = [-0.7]
+                 filters            : str         = 'V_B90 & FUV',
+                 Av_young           : List[float] = [1.0],
+                 Av_old_factor      : List[float] = [0.44],
+                 uv_bump_wavelength : List[float] = [217.5],
+                 uv_bump_width      : List[float] = [35.0],
+                 uv_bump_amplitude  : List[float] = [0.0],
+                 powerlaw_slope     : List[float] = [-0.7]
                 ) -> None:
         
         r'''Init method.'''
         
-        super().__init__('dustatt_2powerlaws', filters=filters)
-        
-        self.filters          = StrProperty(filters)
-        self.Av_BC            = ListFloatProperty(Av_BC,            minBound=0.0)
-        self.slope_BC         = ListFloatProperty(slope_BC)
-        self.BC_to_ISM_factor = ListFloatProperty(BC_to_ISM_factor, minBound=0.0, maxBound=1.0)
-        self.slope_ISM        = ListFloatProperty(slope_ISM)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        super().__init__('dustatt_powerlaw', filters=filters)
         
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
+        self.Av_young           = ListFloatProperty(Av_young,           minBound=0.0)
+        self.Av_old_factor      = ListFloatProperty(Av_old_factor,      minBound=0.0, maxBound=1.0)
+        self.uv_bump_wavelength = ListFloatProperty(uv_bump_wavelength, minBound=0.0)
+        self.uv_bump_width      = ListFloatProperty(uv_bump_width,      minBound=0.0)
+        self.uv_bump_amplitude  = ListFloatProperty(uv_bump_amplitude,  minBound=0.0)
+        self.powerlaw_slope     = ListFloatProperty(powerlaw_slope)
         
-        text = f'''\
+class DUSTATT_2POWERLAWSmodule(ATTENUATIONmodule):
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    Class implementing a double powerlaw attenuation law module: a birth cloud power law applied only to the young star population and an ISM power law applied to both the young and the old stellar populations.
+    
+    **Keyword arguments**
+    
+    :param filters: filters for which the attenuation will be computed and added to the SED information dictionary. You can give several filter names separated by a & (don't use commas).
+    :type filters: :python:`str`
+    :param Av_BC: V-band attenuation in the birth clouds. Minimum is 0.
+    :type Av_BC: :python:`list[float]`
+    :param slope_BC: power law slope of the attenuation in the birth clouds
+    :type slope_BC: :python:`list[float]`
+    :param BC_to_ISM_factor: Av ISM / Av BC. Must be between 0 and 1.
+    :type BC_to_ISM_factor: :python:`list[float]`
+    :param slope_ISM: power law slope of the attenuation in the ISM
+    :type slope_ISM: :python:`list[float]`
+    '''
+    
+    __slots__ = ('Av_BC', 'slope_BC', 'BC_to_ISM_factor', 'slope_ISM')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[dustatt_2powerlaws]]
           # V-band attenuation in the birth clouds.
-          Av_BC = {self.av_BC}
+          Av_BC = {Av_BC}
           # Power law slope of the attenuation in the birth clouds.
-          slope_BC = {self.slope_BC}
+          slope_BC = {slope_BC}
           # Av ISM / Av BC (<1).
-          BC_to_ISM_factor = {self.BC_to_ISM_factor}
+          BC_to_ISM_factor = {BC_to_ISM_factor}
           # Power law slope of the attenuation in the ISM.
-          slope_ISM = {self.slope_ISM}
+          slope_ISM = {slope_ISM}
           # Filters for which the attenuation will be computed and added to the
           # SED information dictionary. You can give several filter names
           # separated by a & (don't use commas).
-          filters = {self.filters}
+          filters = {filters}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[dustatt_2powerlaws]]
           Av_BC = cigale_list(minvalue=0)
           slope_BC = cigale_list()
@@ -1287,9 +1224,24 @@ class DUSTATT_2POWERLAWSmodule(ATTENUATIONmodule):
           slope_ISM = cigale_list()
           filters = string()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 filters          : str         = 'V_B90 & FUV',
+                 Av_BC            : List[float] = [1.0],
+                 slope_BC         : List[float] = [-1.3],
+                 BC_to_ISM_factor : List[float] = [0.44],
+                 slope_ISM        : List[float] = [-0.7]
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('dustatt_2powerlaws', filters=filters)
+        
+        self.Av_BC            = ListFloatProperty(Av_BC,            minBound=0.0)
+        self.slope_BC         = ListFloatProperty(slope_BC)
+        self.BC_to_ISM_factor = ListFloatProperty(BC_to_ISM_factor, minBound=0.0, maxBound=1.0)
+        self.slope_ISM        = ListFloatProperty(slope_ISM)
+        
 class DUSTATT_CALZLETTImodule(ATTENUATIONmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -1314,68 +1266,33 @@ class DUSTATT_CALZLETTImodule(ATTENUATIONmodule):
     :type powerlaw_slope: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 filters            : str         = 'B_B90 & V_B90 & FUV',
-                 E_BVs_young        : List[float] = [0.3],
-                 E_BVs_old_factor   : List[float] = [1.0],
-                 uv_bump_wavelength : List[float] = [217.5],
-                 uv_bump_width      : List[float] = [35.0],
-                 uv_bump_amplitude  : List[float] = [0.0],
-                 powerlaw_slope     : List[float] = [0.0]
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('dustatt_calzleit', filters=filters)
-        
-        self.filters            = StrProperty(filters)
-        self.E_BVs_young        = ListFloatProperty(E_BVs_young,        minBound=0.0)
-        self.E_BVs_old_factor   = ListFloatProperty(E_BVs_old_factor,   minBound=0.0, maxBound=0.0)
-        self.uv_bump_wavelength = ListFloatProperty(uv_bump_wavelength, minBound=0.0)
-        self.uv_bump_width      = ListFloatProperty(uv_bump_width,      minBound=0.0)
-        self.uv_bump_amplitude  = ListFloatProperty(uv_bump_amplitude,  minBound=0.0)
-        self.powerlaw_slope     = ListFloatProperty(powerlaw_slope)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('E_BVs_young', 'E_BVs_old_factor', 'uv_bump_wavelength', 'uv_bump_width', 'uv_bump_amplitude', 'powerlaw_slope')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[dustatt_calzleit]]
           # E(B-V)*, the colour excess of the stellar continuum light for the
           # young population.
-          E_BVs_young = {self.E_BVs_young}
+          E_BVs_young = {E_BVs_young}
           # Reduction factor for the E(B-V)* of the old population compared to the
           # young one (<1).
-          E_BVs_old_factor = {self.E_BVs_old_factor}
+          E_BVs_old_factor = {E_BVs_old_factor}
           # Central wavelength of the UV bump in nm.
-          uv_bump_wavelength = {self.uv_bump_wavelength}
+          uv_bump_wavelength = {uv_bump_wavelength}
           # Width (FWHM) of the UV bump in nm.
-          uv_bump_width = {self.uv_bump_width}
+          uv_bump_width = {uv_bump_width}
           # Amplitude of the UV bump. For the Milky Way: 3.
-          uv_bump_amplitude = {self.uv_bump_amplitude}
+          uv_bump_amplitude = {uv_bump_amplitude}
           # Slope delta of the power law modifying the attenuation curve.
-          powerlaw_slope = {self.powerlaw_slope}
+          powerlaw_slope = {powerlaw_slope}
           # Filters for which the attenuation will be computed and added to the
           # SED information dictionary. You can give several filter names
           # separated by a & (don't use commas).
-          filters = {self.filters}
+          filters = {filters}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[dustatt_calzleit]]
           E_BVs_young = cigale_list(minvalue=0.)
           E_BVs_old_factor = cigale_list(minvalue=0., maxvalue=1.)
@@ -1385,9 +1302,28 @@ class DUSTATT_CALZLETTImodule(ATTENUATIONmodule):
           powerlaw_slope = cigale_list()
           filters = string()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 filters            : str         = 'B_B90 & V_B90 & FUV',
+                 E_BVs_young        : List[float] = [0.3],
+                 E_BVs_old_factor   : List[float] = [1.0],
+                 uv_bump_wavelength : List[float] = [217.5],
+                 uv_bump_width      : List[float] = [35.0],
+                 uv_bump_amplitude  : List[float] = [0.0],
+                 powerlaw_slope     : List[float] = [0.0]
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('dustatt_calzleit', filters=filters)
+        
+        self.E_BVs_young        = ListFloatProperty(E_BVs_young,        minBound=0.0)
+        self.E_BVs_old_factor   = ListFloatProperty(E_BVs_old_factor,   minBound=0.0, maxBound=1.0)
+        self.uv_bump_wavelength = ListFloatProperty(uv_bump_wavelength, minBound=0.0)
+        self.uv_bump_width      = ListFloatProperty(uv_bump_width,      minBound=0.0)
+        self.uv_bump_amplitude  = ListFloatProperty(uv_bump_amplitude,  minBound=0.0)
+        self.powerlaw_slope     = ListFloatProperty(powerlaw_slope)
+        
 class DUSTATT_MODIFIED_CF00module(ATTENUATIONmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -1408,58 +1344,27 @@ class DUSTATT_MODIFIED_CF00module(ATTENUATIONmodule):
     :type slope_BC: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 filters   : str         = 'V_B90 & FUV',
-                 Av_ISM    : List[float] = [1.0],
-                 mu        : List[float] = [0.44],
-                 slope_ISM : List[float] = [-0.7],
-                 slope_BC  : List[float] = [-1.3]
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('dustatt_modified_cf00', filters=filters)
-        
-        self.filters   = StrProperty(filters)
-        self.Av_ISM    = ListFloatProperty(Av_ISM, minBound=0.0)
-        self.mu        = ListFloatProperty(mu,     minBound=0.0001, maxBound=1.0)
-        self.slope_ISM = ListFloatProperty(slope_ISM)
-        self.slope_ISM = ListFloatProperty(slope_BC)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('Av_ISM', 'mu', 'slope_ISM', 'slope_BC')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[dustatt_modified_CF00]]
           # V-band attenuation in the interstellar medium.
-          Av_ISM = {self.Av_ISM}
+          Av_ISM = {Av_ISM}
           # Av_ISM / (Av_BC+Av_ISM)
-          mu = {self.mu}
+          mu = {mu}
           # Power law slope of the attenuation in the ISM.
-          slope_ISM = {self.slope_ISM}
+          slope_ISM = {slope_ISM}
           # Power law slope of the attenuation in the birth clouds.
-          slope_BC = {self.slope_BC}
+          slope_BC = {slope_BC}
           # Filters for which the attenuation will be computed and added to the
           # SED information dictionary. You can give several filter names
           # separated by a & (don't use commas).
-          filters = {self.filters}
+          filters = {filters}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[dustatt_modified_CF00]]
           Av_ISM = cigale_list(minvalue=0)
           mu = cigale_list(minvalue=.0001, maxvalue=1.)
@@ -1467,9 +1372,24 @@ class DUSTATT_MODIFIED_CF00module(ATTENUATIONmodule):
           slope_BC = cigale_list()
           filters = string()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 filters   : str         = 'V_B90 & FUV',
+                 Av_ISM    : List[float] = [1.0],
+                 mu        : List[float] = [0.44],
+                 slope_ISM : List[float] = [-0.7],
+                 slope_BC  : List[float] = [-1.3]
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('dustatt_modified_cf00', filters=filters)
+        
+        self.Av_ISM    = ListFloatProperty(Av_ISM, minBound=0.0)
+        self.mu        = ListFloatProperty(mu,     minBound=0.0001, maxBound=1.0)
+        self.slope_ISM = ListFloatProperty(slope_ISM)
+        self.slope_BC  = ListFloatProperty(slope_BC)
+        
 class DUSTATT_MODIFIED_STARBURSTmodule(ATTENUATIONmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -1498,83 +1418,44 @@ class DUSTATT_MODIFIED_STARBURSTmodule(ATTENUATIONmodule):
     :type Rv: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 filters                : str         = 'B_B90 & V_B90 & FUV',
-                 E_BV_lines             : List[float] = [0.3],
-                 E_BV_factor            : List[float] = [0.44],
-                 uv_bump_wavelength     : List[float] = [217.5],
-                 uv_bump_width          : List[float] = [35.0],
-                 uv_bump_amplitude      : List[float] = [0.0],
-                 powerlaw_slope         : List[float] = [0.0],
-                 Ext_law_emission_lines : List[int]   = 1,
-                 Rv                     : List[float] = 3.1
-                ) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('dustatt_modified_starbust', filters=filters)
-        
-        self.filters                = StrProperty(filters)
-        self.E_BV_lines             = ListFloatProperty(E_BV_lines,           minBound=0.0)
-        self.E_BV_factor            = ListFloatProperty(E_BV_factor,          minBound=0.0, maxBound=1.0)
-        self.uv_bump_wavelength     = ListFloatProperty(uv_bump_wavelength,   minBound=0.0)
-        self.uv_bump_width          = ListFloatProperty(uv_bump_width,        minBound=0.0)
-        self.uv_bump_amplitude      = ListFloatProperty(uv_bump_amplitude,    minBound=0.0)
-        self.powerlaw_slope         = ListFloatProperty(powerlaw_slope)
-        self.Ext_law_emission_lines = ListIntProperty(Ext_law_emission_lines, minBound=1, maxBound=3)
-        self.Rv                     = ListFloatProperty(Rv)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('E_BV_lines', 'E_BV_factor', 'uv_bump_wavelength', 'uv_bump_width', 'uv_bump_amplitude', 'powerlaw_slope', 'Ext_law_emission_lines', 'Rv')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[dustatt_modified_starburst]]
           # E(B-V)l, the colour excess of the nebular lines light for both the
           # young and old population.
-          E_BV_lines = {self.E_BV_lines}
+          E_BV_lines = {E_BV_lines}
           # Reduction factor to apply on E_BV_lines to compute E(B-V)s the stellar
           # continuum attenuation. Both young and old population are attenuated
           # with E(B-V)s.
-          E_BV_factor = {self.E_BV_factor}
+          E_BV_factor = {E_BV_factor}
           # Central wavelength of the UV bump in nm.
-          uv_bump_wavelength = {self.uv_bump_wavelength}
+          uv_bump_wavelength = {uv_bump_wavelength}
           # Width (FWHM) of the UV bump in nm.
-          uv_bump_width = {self.uv_bump_width}
+          uv_bump_width = {uv_bump_width}
           # Amplitude of the UV bump. For the Milky Way: 3.
-          uv_bump_amplitude = {self.uv_bump_amplitude}
+          uv_bump_amplitude = {uv_bump_amplitude}
           # Slope delta of the power law modifying the attenuation curve.
-          powerlaw_slope = {self.powerlaw_slope}
+          powerlaw_slope = {powerlaw_slope}
           # Extinction law to use for attenuating the emissio  n lines flux.
           # Possible values are: 1, 2, 3. 1: MW, 2: LMC, 3: SMC. MW is modelled
           # using CCM89, SMC and LMC using Pei92.
-          Ext_law_emission_lines = {self.Ext_law_emission_lines}
+          Ext_law_emission_lines = {Ext_law_emission_lines}
           # Ratio of total to selective extinction, A_V / E(B-V), for the
           # extinction curve applied to emission lines.Standard value is 3.1 for
           # MW using CCM89, but can be changed.For SMC and LMC using Pei92 the
           # value is automatically set to 2.93 and 3.16 respectively, no matter
           # the value you write.
-          Rv = {self.Rv}
+          Rv = {Rv}
           # Filters for which the attenuation will be computed and added to the
           # SED information dictionary. You can give several filter names
           # separated by a & (don't use commas).
-          filters = {self.filters}
+          filters = {filters}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[dustatt_modified_starburst]]
           E_BV_lines = cigale_list(minvalue=0.)
           E_BV_factor = cigale_list(minvalue=0., maxvalue=1.)
@@ -1586,14 +1467,70 @@ class DUSTATT_MODIFIED_STARBURSTmodule(ATTENUATIONmodule):
           Rv = cigale_list()
           filters = string()\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 filters                : str         = 'B_B90 & V_B90 & FUV',
+                 E_BV_lines             : List[float] = [0.3],
+                 E_BV_factor            : List[float] = [0.44],
+                 uv_bump_wavelength     : List[float] = [217.5],
+                 uv_bump_width          : List[float] = [35.0],
+                 uv_bump_amplitude      : List[float] = [0.0],
+                 powerlaw_slope         : List[float] = [0.0],
+                 Ext_law_emission_lines : List[int]   = [1],
+                 Rv                     : List[float] = [3.1]
+                ) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('dustatt_modified_starburst', filters=filters)
+        
+        self.E_BV_lines             = ListFloatProperty(E_BV_lines,           minBound=0.0)
+        self.E_BV_factor            = ListFloatProperty(E_BV_factor,          minBound=0.0, maxBound=1.0)
+        self.uv_bump_wavelength     = ListFloatProperty(uv_bump_wavelength,   minBound=0.0)
+        self.uv_bump_width          = ListFloatProperty(uv_bump_width,        minBound=0.0)
+        self.uv_bump_amplitude      = ListFloatProperty(uv_bump_amplitude,    minBound=0.0)
+        self.powerlaw_slope         = ListFloatProperty(powerlaw_slope)
+        self.Ext_law_emission_lines = ListIntProperty(Ext_law_emission_lines, minBound=1, maxBound=3)
+        self.Rv                     = ListFloatProperty(Rv)
+        
 ###############################
 #        Dust emission        #
 ###############################
 
-class DUSTmodule(ABC):
+#: Accepted dust temperatures for the schreiber2016 module
+_SCHREIBER_TDUST = frozenset(range(15, 61))
+
+#: Accepted alpha values for the dale2014 module (steps of 0.0625 between 0.0625 and 4.0)
+_DALE_ALPHA      = frozenset(i/16 for i in range(1, 65))
+
+#: Accepted qpah values for the dl2007 module
+_DL07_QPAH       = frozenset((0.47, 1.12, 1.77, 2.50, 3.19, 3.90, 4.58))
+
+#: Accepted umin values for the dl2007 module
+_DL07_UMIN       = frozenset((0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.70, 0.80, 1.00, 1.20, 1.50, 2.00, 2.50, 
+                              3.00, 4.00, 5.00, 7.00, 8.00, 10.0, 12.0, 15.0, 20.0, 25.0))
+
+#: Accepted umax values for the dl2007 module
+_DL07_UMAX       = frozenset((1e3, 1e4, 1e5, 1e6))
+
+#: Accepted qpah values for the dl2014 module
+_DL14_QPAH       = frozenset((0.47, 1.12, 1.77, 2.50, 3.19, 3.90, 4.58, 5.26, 5.95, 6.63, 7.32))
+
+#: Accepted umin values for the dl2014 module
+_DL14_UMIN       = frozenset((0.100, 0.120, 0.150, 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800,
+                              1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000, 6.000, 7.000, 8.000, 
+                              10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00, 35.00, 40.00, 50.00))
+
+#: Accepted qhac values for the themis module
+_THEMIS_QHAC     = frozenset((0.02, 0.06, 0.10, 0.14, 0.17, 0.20, 0.24, 0.28, 0.32, 0.36, 0.40))
+
+#: Accepted umin values for the themis module (same as dl2014 with an additional 80.0)
+_THEMIS_UMIN     = _DL14_UMIN | {80.0}
+
+#: Accepted alpha values for the dl2014 and themis modules (steps of 0.1 between 1.0 and 3.0)
+_DRAINE_ALPHA    = frozenset(i/10 for i in range(10, 31))
+
+class DUSTmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
     
@@ -1602,31 +1539,12 @@ class DUSTmodule(ABC):
     :param name: identifier for the class
     '''
     
+    __slots__ = ()
+    
     def __init__(self, name, *args, **kwargs):
         r'''Init method.'''
         
-        self.name = name
-        
-        return
-        
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        return
-    
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
+        super().__init__(name)
         
         return
     
@@ -1648,6 +1566,31 @@ class MBBmodule(DUSTmodule):
     :type energy_balance: :python:`bool`
     '''
     
+    __slots__ = ('epsilon_mbb', 't_mbb', 'beta_mbb', 'energy_balance')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[mbb]]
+          # Fraction [>= 0] of L_dust(energy balance) in the MBB
+          epsilon_mbb = {epsilon_mbb}
+          # Temperature of black body in K.
+          t_mbb = {t_mbb}
+          # Emissivity index of modified black body.
+          beta_mbb = {beta_mbb}
+          # Energy balance checked?If False, Lum[MBB] not taken into account in
+          # energy balance
+          energy_balance = {energy_balance}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[mbb]]
+          epsilon_mbb = cigale_list(minvalue=0., maxvalue=1.)
+          t_mbb = cigale_list(minvalue=0.)
+          beta_mbb = cigale_list()
+          energy_balance = boolean()\
+        '''
+    
     def __init__(self, 
                  epsilon_mbb    : List[float] = [0.5],
                  t_mbb          : List[float] = [50.0],
@@ -1664,46 +1607,6 @@ class MBBmodule(DUSTmodule):
         self.beta_mbb       = ListFloatProperty(beta_mbb)
         self.energy_balance = BoolProperty(energy_balance)
             
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[mbb]]
-          # Fraction [>= 0] of L_dust(energy balance) in the MBB
-          epsilon_mbb = {self.epsilon_mbb}
-          # Temperature of black body in K.
-          t_mbb = {self.t_mbb}
-          # Emissivity index of modified black body.
-          beta_mbb = {self.beta_mbb}
-          # Energy balance checked?If False, Lum[MBB] not taken into account in
-          # energy balance
-          energy_balance = {self.energy_balance}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[mbb]]
-          epsilon_mbb = cigale_list(minvalue=0., maxvalue=1.)
-          t_mbb = cigale_list(minvalue=0.)
-          beta_mbb = cigale_list()
-          energy_balance = boolean()\
-        '''
-        
-        return text
-    
 class SCHREIBERmodule(DUSTmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -1718,6 +1621,24 @@ class SCHREIBERmodule(DUSTmodule):
     :type fpah: :python:`list[float]`
     '''
     
+    __slots__ = ('tdust', 'fpah')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[schreiber2016]]
+          # Dust temperature. Between 15 and 60K, with 1K step.
+          tdust = {tdust}
+          # Mass fraction of PAH. Between 0 and 1.
+          fpah = {fpah}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[schreiber2016]]
+          tdust = cigale_list(options=15. & 16. & 17. & 18. & 19. & 20. & 21. & 22. & 23. & 24. & 25. & 26. & 27. & 28. & 29. & 30. & 31. & 32. & 33. & 34. & 35. & 36. & 37. & 38. & 39. & 40. & 41. & 42. & 43. & 44. & 45. & 46. & 47. & 48. & 49. & 50. & 51. & 52. & 53. & 54. & 55. & 56. & 57. & 58. & 59. & 60.)
+          fpah = cigale_list(minvalue=0., maxvalue=1.)\
+        '''
+    
     def __init__(self, 
                  tdust : List[int]   = [20],
                  fpah  : List[float] = [0.05]
@@ -1727,47 +1648,12 @@ class SCHREIBERmodule(DUSTmodule):
             
         super().__init__('schreiber2016')
         
-        tdustRange = [15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60]
-            
         self.tdust = ListIntProperty(tdust, minBound=15, maxBound=60,
-                                     testFunc=lambda value: any((i not in tdustRange for i in value)),
-                                     testMsg=f'one of tdust values is not in the list {tdustRange}')
+                                     testFunc=_notIn(_SCHREIBER_TDUST),
+                                     testMsg=_notInMsg('tdust', _SCHREIBER_TDUST))
         
         self.fpah  = ListFloatProperty(fpah, minBound=0.0, maxBound=1.0)
             
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[schreiber2016]]
-          # Dust temperature. Between 15 and 60K, with 1K step.
-          tdust = {self.tdust}
-          # Mass fraction of PAH. Between 0 and 1.
-          fpah = {self.fpah}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[schreiber2016]]
-          tdust = cigale_list(options=15. & 16. & 17. & 18. & 19. & 20. & 21. & 22. & 23. & 24. & 25. & 26. & 27. & 28. & 29. & 30. & 31. & 32. & 33. & 34. & 35. & 36. & 37. & 38. & 39. & 40. & 41. & 42. & 43. & 44. & 45. & 46. & 47. & 48. & 49. & 50. & 51. & 52. & 53. & 54. & 55. & 56. & 57. & 58. & 59. & 60.)
-          fpah = cigale_list(minvalue=0., maxvalue=1.)\
-        '''
-        
-        return text
-    
 class CASEYmodule(DUSTmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -1784,6 +1670,27 @@ class CASEYmodule(DUSTmodule):
     :type alpha: :python:`list[float]`
     '''
     
+    __slots__ = ('temperature', 'beta', 'alpha')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[casey2012]]
+          # Temperature of the dust in K.
+          temperature = {temperature}
+          # Emissivity index of the dust.
+          beta = {beta}
+          # Mid-infrared powerlaw slope.
+          alpha = {alpha}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[casey2012]]
+          temperature = cigale_list(minvalue=0.)
+          beta = cigale_list(minvalue=0.)
+          alpha = cigale_list(minvalue=0.)\
+        '''
+    
     def __init__(self, 
                  temperature : List[float] = [35.0],
                  beta        : List[float] = [1.6],
@@ -1798,42 +1705,6 @@ class CASEYmodule(DUSTmodule):
         self.beta        = ListFloatProperty(beta,        minBound=0.0)
         self.alpha       = ListFloatProperty(alpha,       minBound=0.0)
             
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[casey2012]]
-          # Temperature of the dust in K.
-          temperature = {self.temperature}
-          # Emissivity index of the dust.
-          beta = {self.beta}
-          # Mid-infrared powerlaw slope.
-          alpha = {self.alpha}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[casey2012]]
-          temperature = cigale_list(minvalue=0.)
-          beta = cigale_list(minvalue=0.)
-          alpha = cigale_list(minvalue=0.)\
-        '''
-        
-        return text
-    
 class DALEmodule(DUSTmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -1852,40 +1723,14 @@ class DALEmodule(DUSTmodule):
     :type alpha: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 fracAGN : List[float] = [0.0],
-                 alpha   : List[float] = [2.0]
-                ) -> None:
+    __slots__ = ('fracAGN', 'alpha')
     
-        r'''Init method.'''
-        
-        super().__init__('dale2014')
-        
-        # Accepted values for alpha
-        alphaRange = [0.0625, 0.1250, 0.1875, 0.2500, 0.3125, 0.3750, 0.4375, 0.5000, 0.5625, 0.6250, 0.6875, 0.7500,
-                      0.8125, 0.8750, 0.9375, 1.0000, 1.0625, 1.1250, 1.1875, 1.2500, 1.3125, 1.3750, 1.4375, 1.5000, 
-                      1.5625, 1.6250, 1.6875, 1.7500, 1.8125, 1.8750, 1.9375, 2.0000, 2.0625, 2.1250, 2.1875, 2.2500,
-                      2.3125, 2.3750, 2.4375, 2.5000, 2.5625, 2.6250, 2.6875, 2.7500, 2.8125, 2.8750, 2.9375, 3.0000, 
-                      3.0625, 3.1250, 3.1875, 3.2500, 3.3125, 3.3750, 3.4375, 3.5000, 3.5625, 3.6250, 3.6875, 3.7500,
-                      3.8125, 3.8750, 3.9375, 4.0000]
-        
-        self.fracAGN = ListFloatProperty(fracAGN, minBound=0.0,    maxBound=1.0)
-        self.alpha   = ListFloatProperty(alpha,   minBound=0.0625, maxBound=4.0,
-                                         testFunc=lambda value: any((i not in alphaRange for i in value)),
-                                         testMsg=f'One on the alpha values is not accepted. Accepted values must be in the list {alphaRange}.')
-        
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[dale2014]]
           # AGN fraction. It is not recommended to combine this AGN emission with
           # the of Fritz et al. (2006) models.
-          fracAGN = {self.fracAGN}
+          fracAGN = {fracAGN}
           # Alpha slope. Possible values are: 0.0625, 0.1250, 0.1875, 0.2500,
           # 0.3125, 0.3750, 0.4375, 0.5000, 0.5625, 0.6250, 0.6875, 0.7500,
           # 0.8125, 0.8750, 0.9375, 1.0000, 1.0625, 1.1250, 1.1875, 1.2500,
@@ -1895,27 +1740,30 @@ class DALEmodule(DUSTmodule):
           # 2.8125, 2.8750, 2.9375, 3.0000, 3.0625, 3.1250, 3.1875, 3.2500,
           # 3.3125, 3.3750, 3.4375, 3.5000, 3.5625, 3.6250, 3.6875, 3.7500,
           # 3.8125, 3.8750, 3.9375, 4.0000
-          alpha = {self.alpha}
+          alpha = {alpha}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[dale2014]]
           fracAGN = cigale_list(minvalue=0., maxvalue=1.)
           alpha = cigale_list(options=0.0625 & 0.1250 & 0.1875 & 0.2500 & 0.3125 & 0.3750 & 0.4375 & 0.5000 & 0.5625 & 0.6250 & 0.6875 & 0.7500 & 0.8125 & 0.8750 & 0.9375 & 1.0000 & 1.0625 & 1.1250 & 1.1875 & 1.2500 & 1.3125 & 1.3750 & 1.4375 & 1.5000 & 1.5625 & 1.6250 & 1.6875 & 1.7500 & 1.8125 & 1.8750 & 1.9375 & 2.0000 & 2.0625 & 2.1250 & 2.1875 & 2.2500 & 2.3125 & 2.3750 & 2.4375 & 2.5000 & 2.5625 & 2.6250 & 2.6875 & 2.7500 & 2.8125 & 2.8750 & 2.9375 & 3.0000 & 3.0625 & 3.1250 & 3.1875 & 3.2500 & 3.3125 & 3.3750 & 3.4375 & 3.5000 & 3.5625 & 3.6250 & 3.6875 & 3.7500 & 3.8125 & 3.8750 & 3.9375 & 4.0000)\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 fracAGN : List[float] = [0.0],
+                 alpha   : List[float] = [2.0]
+                ) -> None:
+    
+        r'''Init method.'''
+        
+        super().__init__('dale2014')
+        
+        self.fracAGN = ListFloatProperty(fracAGN, minBound=0.0,    maxBound=1.0)
+        self.alpha   = ListFloatProperty(alpha,   minBound=0.0625, maxBound=4.0,
+                                         testFunc=_notIn(_DALE_ALPHA),
+                                         testMsg=_notInMsg('alpha', _DALE_ALPHA))
+        
 class DL07module(DUSTmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -1934,6 +1782,34 @@ class DL07module(DUSTmodule):
     :type gamma: :python:`list[float]`
     '''
     
+    __slots__ = ('qpah', 'umin', 'umax', 'gamma')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[dl2007]]
+          # Mass fraction of PAH. Possible values are: 0.47, 1.12, 1.77, 2.50,
+          # 3.19, 3.90, 4.58.
+          qpah = {qpah}
+          # Minimum radiation field. Possible values are: 0.10, 0.15, 0.20, 0.30,
+          # 0.40, 0.50, 0.70, 0.80, 1.00, 1.20, 1.50, 2.00, 2.50, 3.00, 4.00,
+          # 5.00, 7.00, 8.00, 10.0, 12.0, 15.0, 20.0, 25.0.
+          umin = {umin}
+          # Maximum radiation field. Possible values are: 1e3, 1e4, 1e5, 1e6.
+          umax = {umax}
+          # Fraction illuminated from Umin to Umax. Possible values between 0 and
+          # 1.
+          gamma = {gamma}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[dl2007]]
+          qpah = cigale_list(options=0.47 & 1.12 & 1.77 & 2.50 & 3.19 & 3.90 & 4.58)
+          umin = cigale_list(options=0.10 & 0.15 & 0.20 & 0.30 & 0.40 & 0.50 & 0.70 & 0.80 & 1.00 & 1.20 & 1.50 & 2.00 & 2.50 & 3.00 & 4.00 & 5.00 & 7.00 & 8.00 & 10.0 & 12.0 & 15.0 & 20.0 & 25.0)
+          umax = cigale_list(options=1e3 & 1e4 & 1e5 & 1e6)
+          gamma = cigale_list(minvalue=0., maxvalue=1.)\
+        '''
+    
     def __init__(self, 
                  qpah  : List[float] = [2.5],
                  umin  : List[float] = [1.0],
@@ -1945,75 +1821,22 @@ class DL07module(DUSTmodule):
         
         super().__init__('dl2077')
         
-        # Accepted values for qpah
-        qpahRange = [0.47, 1.12, 1.77, 2.50, 3.19, 3.90, 4.58]
-        
-        # Accepted values for umin
-        uminRange = [0.10, 0.15, 0.20, 0.30, 0.40, 0.50, 0.70, 0.80, 1.00, 1.20, 1.50, 2.00, 2.50, 
-                     3.00, 4.00, 5.00, 7.00, 8.00, 10.0, 12.0, 15.0, 20.0, 25.0]
-        
-        # Accepted values for umax
-        umaxRange = [1e3, 1e4, 1e5, 1e6]
-        
         self.qpah: List[float]  = ListFloatProperty(qpah, minBound=0.47, maxBound=4.58,
-                                                    testFunc=lambda value: any((i not in qpahRange for i in value)),
-                                                    testMsg=f'One on the qpah values is not accepted. Accepted values must be in the list {qpahRange}.')
+                                                    testFunc=_notIn(_DL07_QPAH),
+                                                    testMsg=_notInMsg('qpah', _DL07_QPAH))
         
         
         self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=25.0,
-                                                    testFunc=lambda value: any((i not in uminRange for i in value)),
-                                                    testMsg=f'One on the umin values is not accepted. Accepted values must be in the list {uminRange}.')
+                                                    testFunc=_notIn(_DL07_UMIN),
+                                                    testMsg=_notInMsg('umin', _DL07_UMIN))
         
         
         self.umax: List[float]  = ListFloatProperty(umax, minBound=1e3, maxBound=1e6,
-                                                    testFunc=lambda value: any((i not in umaxRange for i in value)),
-                                                    testMsg=f'One on the umax values is not accepted. Accepted values must be in the list {umaxRange}.')
+                                                    testFunc=_notIn(_DL07_UMAX),
+                                                    testMsg=_notInMsg('umax', _DL07_UMAX))
         
         self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
         
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[dl2007]]
-          # Mass fraction of PAH. Possible values are: 0.47, 1.12, 1.77, 2.50,
-          # 3.19, 3.90, 4.58.
-          qpah = {self.qpah}
-          # Minimum radiation field. Possible values are: 0.10, 0.15, 0.20, 0.30,
-          # 0.40, 0.50, 0.70, 0.80, 1.00, 1.20, 1.50, 2.00, 2.50, 3.00, 4.00,
-          # 5.00, 7.00, 8.00, 10.0, 12.0, 15.0, 20.0, 25.0.
-          umin = {self.umin}
-          # Maximum radiation field. Possible values are: 1e3, 1e4, 1e5, 1e6.
-          umax = {self.umax}
-          # Fraction illuminated from Umin to Umax. Possible values between 0 and
-          # 1.
-          gamma = {self.gamma}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[dl2007]]
-          qpah = cigale_list(options=0.47 & 1.12 & 1.77 & 2.50 & 3.19 & 3.90 & 4.58)
-          umin = cigale_list(options=0.10 & 0.15 & 0.20 & 0.30 & 0.40 & 0.50 & 0.70 & 0.80 & 1.00 & 1.20 & 1.50 & 2.00 & 2.50 & 3.00 & 4.00 & 5.00 & 7.00 & 8.00 & 10.0 & 12.0 & 15.0 & 20.0 & 25.0)
-          umax = cigale_list(options=1e3 & 1e4 & 1e5 & 1e6)
-          gamma = cigale_list(minvalue=0., maxvalue=1.)\
-        '''
-        
-        return text
-    
 class DL14module(DUSTmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -2032,90 +1855,64 @@ class DL14module(DUSTmodule):
     :type gamma: :python:`list[float]`
     '''
     
-    def __init__(self, 
-                 qpah  : List[float] = [2.5],
-                 umin  : List[float] = [1.0],
-                 gamma : List[float] = [0.1],
-                 alpha : List[float] = [2.0]
-                ) -> None:
+    __slots__ = ('qpah', 'umin', 'alpha', 'gamma')
     
-        r'''Init method.'''
-        
-        super().__init__('dl2014')
-        
-        # Accepted values for qpah
-        qpahRange  = [0.47, 1.12, 1.77, 2.50, 3.19, 3.90, 4.58, 5.26, 5.95, 6.63, 7.32]
-        
-        # Accepted values for umin
-        uminRange  = [0.100, 0.120, 0.150, 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800,
-                      1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000, 6.000, 7.000, 8.000, 
-                      10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00, 35.00, 40.00, 50.00]
-        
-        # Accepted values for alpha
-        alphaRange = [1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3.0]
-        
-        self.qpah: List[float]  = ListFloatProperty(qpah, minBound=0.47, maxBound=7.32,
-                                                    testFunc=lambda value: any((i not in qpahRange for i in value)),
-                                                    testMsg=f'One on the qpah values is not accepted. Accepted values must be in the list {qpahRange}.')
-        
-        
-        self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=50.0,
-                                                    testFunc=lambda value: any((i not in uminRange for i in value)),
-                                                    testMsg=f'One on the umin values is not accepted. Accepted values must be in the list {uminRange}.')
-        
-        self.alpha: List[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
-                                                    testFunc=lambda value: any((i not in alphaRange for i in value)),
-                                                    testMsg=f'One on the alpha values is not accepted. Accepted values must be in the list {alphaRange}.')
-        
-        self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
-        
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[dl2014]]
           # Mass fraction of PAH. Possible values are: 0.47, 1.12, 1.77, 2.50,
           # 3.19, 3.90, 4.58, 5.26, 5.95, 6.63, 7.32.
-          qpah = {self.qpah}
+          qpah = {qpah}
           # Minimum radiation field. Possible values are: 0.100, 0.120, 0.150,
           # 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800,
           # 1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000,
           # 6.000, 7.000, 8.000, 10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00,
           # 35.00, 40.00, 50.00.
-          umin = {self.umin}
+          umin = {umin}
           # Powerlaw slope dU/dM propto U^alpha. Possible values are: 1.0, 1.1,
           # 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5,
           # 2.6, 2.7, 2.8, 2.9, 3.0.
-          alpha = {self.alpha}
+          alpha = {alpha}
           # Fraction illuminated from Umin to Umax. Possible values between 0 and
           # 1.
-          gamma = {self.gamma}
+          gamma = {gamma}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[dl2014]]
           qpah = cigale_list(options=0.47 & 1.12 & 1.77 & 2.50 & 3.19 & 3.90 & 4.58 & 5.26 & 5.95 & 6.63 & 7.32)
           umin = cigale_list(options=0.10 & 0.12 & 0.15 & 0.17 & 0.20 & 0.25 & 0.30 & 0.35 & 0.40 & 0.50 & 0.60 & 0.70 & 0.80 & 1.00 & 1.20 & 1.50 & 1.70 & 2.00 & 2.50 & 3.00 & 3.50 & 4.00 & 5.00 & 6.00 & 7.00 & 8.00 & 10.00 & 12.00 & 15.00 & 17.00 & 20.00 & 25.00 & 30.00 & 35.00 & 40.00 & 50.00)
           alpha = cigale_list(options=1.0 & 1.1 & 1.2 & 1.3 & 1.4 & 1.5 & 1.6 & 1.7 & 1.8 & 1.9 & 2.0 & 2.1 & 2.2 & 2.3 & 2.4 & 2.5 & 2.6 & 2.7 & 2.8 & 2.9 & 3.0)
           gamma = cigale_list(minvalue=0., maxvalue=1.)\
         '''
-        
-        return text
     
+    def __init__(self, 
+                 qpah  : List[float] = [2.5],
+                 umin  : List[float] = [1.0],
+                 gamma : List[float] = [0.1],
+                 alpha : List[float] = [2.0]
+                ) -> None:
+    
+        r'''Init method.'''
+        
+        super().__init__('dl2014')
+        
+        self.qpah: List[float]  = ListFloatProperty(qpah, minBound=0.47, maxBound=7.32,
+                                                    testFunc=_notIn(_DL14_QPAH),
+                                                    testMsg=_notInMsg('qpah', _DL14_QPAH))
+        
+        
+        self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=50.0,
+                                                    testFunc=_notIn(_DL14_UMIN),
+                                                    testMsg=_notInMsg('umin', _DL14_UMIN))
+        
+        self.alpha: List[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
+                                                    testFunc=_notIn(_DRAINE_ALPHA),
+                                                    testMsg=_notInMsg('alpha', _DRAINE_ALPHA))
+        
+        self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
+        
 class THEMISmodule(DUSTmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -2134,94 +1931,104 @@ class THEMISmodule(DUSTmodule):
     :type gamma: :python:`list[float]`
     '''
     
-    def __init__(self, qhac: List[float] = [0.17],
-                 umin: List[float]       = [1.0],
-                 gamma: List[float]      = [0.1],
-                 alpha: List[float]      = [2.0]) -> None:
+    __slots__ = ('qhac', 'umin', 'alpha', 'gamma')
     
-        r'''Init method.'''
-        
-        super().__init__('themis')
-        
-        # Accepted values for qpah
-        qhacRange  = [0.02, 0.06, 0.10, 0.14, 0.17, 0.20, 0.24, 0.28, 0.32, 0.36, 0.40]
-        
-        # Accepted values for umin
-        uminRange  = [0.100, 0.120, 0.150, 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800,
-                      1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000, 6.000, 7.000, 8.000, 
-                      10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00, 35.00, 40.00, 50.00, 80.00]
-        
-        # Accepted values for alpha
-        alphaRange = [1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3.0]
-        
-        self.qhac: List[float]  = ListFloatProperty(qhac, minBound=0.02, maxBound=0.4,
-                                                    testFunc=lambda value: any((i not in qhacRange for i in value)),
-                                                    testMsg=f'One on the qhac values is not accepted. Accepted values must be in the list {qhacRange}.')
-        
-        
-        self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=80.0,
-                                                    testFunc=lambda value: any((i not in uminRange for i in value)),
-                                                    testMsg=f'One on the umin values is not accepted. Accepted values must be in the list {uminRange}.')
-        
-        self.alpha: List[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
-                                                    testFunc=lambda value: any((i not in alphaRange for i in value)),
-                                                    testMsg=f'One on the alpha values is not accepted. Accepted values must be in the list {alphaRange}.')
-        
-        self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
-        
-    def __str__(self, *args, **kwargs):
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[themis]]
           # Mass fraction of hydrocarbon solids i.e., a-C(:H) smaller than 1.5 nm,
           # also known as HAC. Possible values are: 0.02, 0.06, 0.10, 0.14, 0.17,
           # 0.20, 0.24, 0.28, 0.32, 0.36, 0.40.
-          qhac = {self.qhac}
+          qhac = {qhac}
           # Minimum radiation field. Possible values are: 0.100, 0.120, 0.150,
           # 0.170, 0.200, 0.250, 0.300, 0.350, 0.400, 0.500, 0.600, 0.700, 0.800,
           # 1.000, 1.200, 1.500, 1.700, 2.000, 2.500, 3.000, 3.500, 4.000, 5.000,
           # 6.000, 7.000, 8.000, 10.00, 12.00, 15.00, 17.00, 20.00, 25.00, 30.00,
           # 35.00, 40.00, 50.00, 80.00.
-          umin = {self.umin}
+          umin = {umin}
           # Powerlaw slope dU/dM propto U^alpha. Possible values are: 1.0, 1.1,
           # 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4, 2.5,
           # 2.6, 2.7, 2.8, 2.9, 3.0.
-          alpha = {self.alpha}
+          alpha = {alpha}
           # Fraction illuminated from Umin to Umax. Possible values between 0 and
           # 1.
-          gamma = {self.gamma}
+          gamma = {gamma}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[themis]]
           qhac = cigale_list(options=0.02 & 0.06 & 0.10 & 0.14 & 0.17 & 0.20 & 0.24 & 0.28 & 0.32 & 0.36 & 0.40)
           umin = cigale_list(options=0.10 & 0.12 & 0.15 & 0.17 & 0.20 & 0.25 & 0.30 & 0.35 & 0.40 & 0.50 & 0.60 & 0.70 & 0.80 & 1.00 & 1.20 & 1.50 & 1.70 & 2.00 & 2.50 & 3.00 & 3.50 & 4.00 & 5.00 & 6.00 & 7.00 & 8.00 & 10.00 & 12.00 & 15.00 & 17.00 & 20.00 & 25.00 & 30.00 & 35.00 & 40.00 & 50.00 & 80.00)
           alpha = cigale_list(options=1.0 & 1.1 & 1.2 & 1.3 & 1.4 & 1.5 & 1.6 & 1.7 & 1.8 & 1.9 & 2.0 & 2.1 & 2.2 & 2.3 & 2.4 & 2.5 & 2.6 & 2.7 & 2.8 & 2.9 & 3.0)
           gamma = cigale_list(minvalue=0., maxvalue=1.)\
         '''
-        
-        return text
     
+    def __init__(self, qhac: List[float] = [0.17],
+                 umin: List[float]       = [1.0],
+                 gamma: List[float]      = [0.1],
+                 alpha: List[float]      = [2.0]) -> None:
+    
+        r'''Init method.'''
+        
+        super().__init__('themis')
+        
+        self.qhac: List[float]  = ListFloatProperty(qhac, minBound=0.02, maxBound=0.4,
+                                                    testFunc=_notIn(_THEMIS_QHAC),
+                                                    testMsg=_notInMsg('qhac', _THEMIS_QHAC))
+        
+        
+        self.umin: List[float]  = ListFloatProperty(umin, minBound=0.1, maxBound=80.0,
+                                                    testFunc=_notIn(_THEMIS_UMIN),
+                                                    testMsg=_notInMsg('umin', _THEMIS_UMIN))
+        
+        self.alpha: List[float] = ListFloatProperty(alpha, minBound=1.0, maxBound=3.0,
+                                                    testFunc=_notIn(_DRAINE_ALPHA),
+                                                    testMsg=_notInMsg('alpha', _DRAINE_ALPHA))
+        
+        self.gamma: List[float] = ListFloatProperty(gamma, minBound=0.0, maxBound=1.0)
+        
 #####################
 #        AGN        #
 #####################
 
-class AGNmodule(ABC):
+#: Accepted r_ratio values for the fritz2006 module
+_FRITZ_R_RATIO       = frozenset((10, 30, 60, 100, 150))
+
+#: Accepted tau values for the fritz2006 module
+_FRITZ_TAU           = frozenset((0.1, 0.3, 0.6, 1.0, 2.0, 3.0, 6.0, 10.0))
+
+#: Accepted beta values for the fritz2006 module
+_FRITZ_BETA          = frozenset((-1.0, -0.75, -0.5, -0.25, 0.0))
+
+#: Accepted gamma values for the fritz2006 module
+_FRITZ_GAMMA         = frozenset((0, 2, 4, 6))
+
+#: Accepted opening_angle values for the fritz2006 module
+_FRITZ_OPENING_ANGLE = frozenset((60, 100, 140))
+
+#: Accepted psy values for the fritz2006 module
+_FRITZ_PSY           = frozenset((0.001, 10.10, 20.10, 30.10, 40.10, 50.10, 60.10, 70.10, 80.10, 89.99))
+
+#: Accepted t values for the skirtor2016 module
+_SKIRTOR_T           = frozenset((3, 5, 7, 9, 11))
+
+#: Accepted pl and q values for the skirtor2016 module
+_SKIRTOR_PL_Q        = frozenset((0.0, 0.5, 1.0, 1.5))
+
+#: Accepted oa values for the skirtor2016 module
+_SKIRTOR_OA          = frozenset((10, 20, 30, 40, 50, 60, 70, 80))
+
+#: Accepted R values for the skirtor2016 module
+_SKIRTOR_R           = frozenset((10, 20, 30))
+
+#: Accepted Mcl values for the skirtor2016 module
+_SKIRTOR_MCL         = frozenset((0.97,))
+
+#: Accepted i values for the skirtor2016 module
+_SKIRTOR_I           = frozenset((0, 10, 20, 30, 40, 50, 60, 70, 80, 90))
+
+class AGNmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -2231,35 +2038,16 @@ class AGNmodule(ABC):
     :param list fracAGN: (**Optional**) AGN fraction
     '''
     
+    __slots__ = ('fracAGN',)
+    
     def __init__(self, name, fracAGN: List[float] = [0.1], **kwargs) -> None:
         r'''Init method.'''
         
-        self.name    = name
+        super().__init__(name)
         self.fracAGN = ListFloatProperty(fracAGN, minBound=0.0, maxBound=1.0)
         
         return
-        
-    @abstractmethod
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        return
     
-    @property
-    @abstractmethod
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        return
-
 class FRITZmodule(AGNmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -2275,103 +2063,34 @@ class FRITZmodule(AGNmodule):
     :param list fracAGN: (**Optional**) AGN fraction
     '''
     
-    def __init__(self, r_ratio: List[int] = [60.0],
-                 tau: List[float]         = [1.0],
-                 beta: List[float]        = [-0.5],
-                 gamma: List[int]         = [4],
-                 opening_angle: List[int] = [100],
-                 psy: List[float]         = [50.1],
-                 fracAGN: List[float]     = [0.1]) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('fritz2006', fracAGN=fracAGN)
-        
-        # Accepted values for r_ratio
-        r_ratioRange       = [10, 30, 60, 100, 150]
-        
-        # Accepted values for tau
-        tauRange           = [0.1, 0.3, 0.6, 1.0, 2.0, 3.0, 6.0, 10.0]
-        
-        # Accepted values for beta
-        betaRange          = [-1.0, -0.75, -0.5, -0.25, 0.0]
-        
-        # Accepted values for gamma
-        gammaRange         = [0, 2, 4, 6]
-        
-        # Accepted values for opening_angle
-        opening_angleRange = [60, 100, 140]
-        
-        # Accepted values for psy
-        psyRange           = [0.001, 10.10, 20.10, 30.10, 40.10, 50.10, 60.10, 70.10, 80.10, 89.99]
-        
-        
-        self.r_ratio       = ListFloatProperty(r_ratio, minBound=10, maxBound=150,
-                                               testFunc=lambda value: any((i not in r_ratioRange for i in value)),
-                                               testMsg=f'One on the r_ratio values is not accepted. Accepted values must be in the list {r_ratioRange}.')
-        
-        
-        self.tau           = ListFloatProperty(tau, minBound=0.1, maxBound=10.0,
-                                               testFunc=lambda value: any((i not in tauRange for i in value)),
-                                               testMsg=f'One on the tau values is not accepted. Accepted values must be in the list {tauRange}.')
-        
-        self.beta          = ListFloatProperty(beta, minBound=-1.0, maxBound=0.0,
-                                               testFunc=lambda value: any((i not in betaRange for i in value)),
-                                               testMsg=f'One on the beta values is not accepted. Accepted values must be in the list {betaRange}.')
-        
-        self.gamma         = ListFloatProperty(gamma, minBound=0, maxBound=6,
-                                               testFunc=lambda value: any((i not in gammaRange for i in value)),
-                                               testMsg=f'One on the gamma values is not accepted. Accepted values must be in the list {gammaRange}.')
-        
-        self.opening_angle = ListFloatProperty(opening_angle, minBound=60, maxBound=140,
-                                               testFunc=lambda value: any((i not in opening_angleRange for i in value)),
-                                               testMsg=f'One on the opening_angle values is not accepted. Accepted values must be in the list {opening_angleRange}.')
-        
-        self.psy           = ListFloatProperty(psy, minBound=0.001, maxBound=89.99,
-                                               testFunc=lambda value: any((i not in psyRange for i in value)),
-                                               testMsg=f'One on the psy values is not accepted. Accepted values must be in the list {psyRange}.')
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('r_ratio', 'tau', 'beta', 'gamma', 'opening_angle', 'psy')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[fritz2006]]
           # Ratio of the maximum to minimum radii of the dust torus. Possible
           # values are: 10, 30, 60, 100, 150.
-          r_ratio = {self.r_ratio}
+          r_ratio = {r_ratio}
           # Optical depth at 9.7 microns. Possible values are: 0.1, 0.3, 0.6, 1.0,
           # 2.0, 3.0, 6.0, 10.0.
-          tau = {self.tau}
+          tau = {tau}
           # Beta. Possible values are: -1.00, -0.75, -0.50, -0.25, 0.00.
-          beta = {self.beta}
+          beta = {beta}
           # Gamma. Possible values are: 0.0, 2.0, 4.0, 6.0.
-          gamma = {self.gamma}
+          gamma = {gamma}
           # Full opening angle of the dust torus (Fig 1 of Fritz 2006). Possible
           # values are: 60., 100., 140.
-          opening_angle = {self.opening_angle}
+          opening_angle = {opening_angle}
           # Angle between equatorial axis and line of sight. Psy = 90◦ for type 1
           # and Psy = 0° for type 2. Possible values are: 0.001, 10.100, 20.100,
           # 30.100, 40.100, 50.100, 60.100, 70.100, 80.100, 89.990.
-          psy = {self.psy}
+          psy = {psy}
           # AGN fraction.
-          fracAGN = {self.fracAGN}
+          fracAGN = {fracAGN}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[fritz2006]]
           r_ratio = cigale_list(options=10. & 30. & 60. & 100. & 150.)
           tau = cigale_list(options=0.1 & 0.3 & 0.6 & 1.0 & 2.0 & 3.0 & 6.0 & 10.0)
@@ -2381,9 +2100,44 @@ class FRITZmodule(AGNmodule):
           psy = cigale_list(options=0.001 & 10.100 & 20.100 & 30.100 & 40.100 & 50.100 & 60.100 & 70.100 & 80.100 & 89.990)
           fracAGN = cigale_list(minvalue=0., maxvalue=1.)\
         '''
-        
-        return text
     
+    def __init__(self, r_ratio: List[float]     = [60.0],
+                 tau: List[float]           = [1.0],
+                 beta: List[float]          = [-0.5],
+                 gamma: List[float]         = [4.0],
+                 opening_angle: List[float] = [100.0],
+                 psy: List[float]           = [50.1],
+                 fracAGN: List[float]       = [0.1]) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('fritz2006', fracAGN=fracAGN)
+        
+        self.r_ratio       = ListFloatProperty(r_ratio, minBound=10, maxBound=150,
+                                               testFunc=_notIn(_FRITZ_R_RATIO),
+                                               testMsg=_notInMsg('r_ratio', _FRITZ_R_RATIO))
+        
+        
+        self.tau           = ListFloatProperty(tau, minBound=0.1, maxBound=10.0,
+                                               testFunc=_notIn(_FRITZ_TAU),
+                                               testMsg=_notInMsg('tau', _FRITZ_TAU))
+        
+        self.beta          = ListFloatProperty(beta, minBound=-1.0, maxBound=0.0,
+                                               testFunc=_notIn(_FRITZ_BETA),
+                                               testMsg=_notInMsg('beta', _FRITZ_BETA))
+        
+        self.gamma         = ListFloatProperty(gamma, minBound=0, maxBound=6,
+                                               testFunc=_notIn(_FRITZ_GAMMA),
+                                               testMsg=_notInMsg('gamma', _FRITZ_GAMMA))
+        
+        self.opening_angle = ListFloatProperty(opening_angle, minBound=60, maxBound=140,
+                                               testFunc=_notIn(_FRITZ_OPENING_ANGLE),
+                                               testMsg=_notInMsg('opening_angle', _FRITZ_OPENING_ANGLE))
+        
+        self.psy           = ListFloatProperty(psy, minBound=0.001, maxBound=89.99,
+                                               testFunc=_notIn(_FRITZ_PSY),
+                                               testMsg=_notInMsg('psy', _FRITZ_PSY))
+        
 class SKIRTORmodule(AGNmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
@@ -2400,116 +2154,42 @@ class SKIRTORmodule(AGNmodule):
     :param list fracAGN: (**Optional**) AGN fraction
     '''
     
-    def __init__(self, t: List[int]   = [3],
-                 pl: List[float]      = [1.0],
-                 q: List[float]       = [1.0],
-                 oa: List[int]        = [40],
-                 R: List[int]         = [20],
-                 Mcl: List[float]     = [0.97],
-                 i: List[int]         = [40],
-                 fracAGN: List[float] = [0.1]) -> None:
-        
-        r'''Init method.'''
-        
-        super().__init__('skirtor2016', fracAGN=fracAGN)
-        
-        # Accepted values for t
-        tRange    = [3, 5, 7, 9, 11]
-        
-        # Accepted values for pl and q
-        pl_qRange = [0.0, 0.5, 1.0, 1.5]
-        
-        # Accepted values for oa
-        oaRange   = [10, 20, 30, 40, 50, 60, 70, 80]
-        
-        # Accepted values for R
-        RRange    = [10, 20, 30]
-        
-        # Accepted values for Mcl
-        MclRange  = [0.97]
-        
-        # Accepted values for i
-        iRange    = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90]
-        
-        
-        self.t   =  ListIntProperty(t, minBound=3, maxBound=11,
-                                    testFunc=lambda value: any((i not in tRange for i in value)),
-                                    testMsg=f'One on the t values is not accepted. Accepted values must be in the list {tRange}.')
-        
-        
-        self.pl   = ListFloatProperty(pl, minBound=0.0, maxBound=1.5,
-                                      testFunc=lambda value: any((i not in pl_qRange for i in value)),
-                                      testMsg=f'One on the pl values is not accepted. Accepted values must be in the list {pl_qRange}.')
-        
-        self.q    = ListFloatProperty(q, minBound=0.0, maxBound=1.5,
-                                      testFunc=lambda value: any((i not in pl_qRange for i in value)),
-                                      testMsg=f'One on the q values is not accepted. Accepted values must be in the list {pl_qRange}.')
-        
-        self.oa   = ListIntProperty(oa, minBound=10, maxBound=80,
-                                    testFunc=lambda value: any((i not in oaRange for i in value)),
-                                    testMsg=f'One on the oa values is not accepted. Accepted values must be in the list {oaRange}.')
-        
-        self.R    = ListFloatProperty(R, minBound=10, maxBound=30,
-                                      testFunc=lambda value: any((i not in RRange for i in value)),
-                                      testMsg=f'One on the R values is not accepted. Accepted values must be in the list {RRange}.')
-        
-        self.Mcl  = ListFloatProperty(Mcl, minBound=0.97, maxBound=0.97,
-                                      testFunc=lambda value: any((i not in MclRange for i in value)),
-                                      testMsg=f'One on the Mcl values is not accepted. Accepted values must be in the list {MclRange}.')
-        
-        self.i    = ListIntProperty(i, minBound=0, maxBound=90,
-                                    testFunc=lambda value: any((i not in iRange for i in value)),
-                                    testMsg=f'One on the i values is not accepted. Accepted values must be in the list {iRange}.')
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('t', 'pl', 'q', 'oa', 'R', 'Mcl', 'i')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[skirtor2016]]
           # Average edge-on optical depth at 9.7 micron; the actual one alongthe
           # line of sight may vary depending on the clumps distribution. Possible
           # values are: 3, 5, 7, 8, and 11.
-          t = {self.ts}
+          t = {t}
           # Power-law exponent that sets radial gradient of dust density.Possible
           # values are: 0., 0.5, 1., and 1.5.
-          pl = {self.pl}
+          pl = {pl}
           # Index that sets dust density gradient with polar angle.Possible values
           # are:  0., 0.5, 1., and 1.5.
-          q = {self.q}
+          q = {q}
           # Angle measured between the equatorial plan and edge of the torus.
           # Half-opening angle of the dust-free cone is 90-oaPossible values are:
           # 10, 20, 30, 40, 50, 60, 70, and 80
-          oa = {self.oa}
+          oa = {oa}
           # Ratio of outer to inner radius, R_out/R_in.Possible values are: 10,
           # 20, and 30
-          R = {self.R}
+          R = {R}
           # fraction of total dust mass inside clumps. 0.97 means 97% of total
           # mass is inside the clumps and 3% in the interclump dust. Possible
           # values are: 0.97.
-          Mcl = {self.Mcl}
+          Mcl = {Mcl}
           # inclination, i.e. viewing angle, i.e. position of the instrument
           # w.r.t. the AGN axis. i=0: face-on, type 1 view; i=90: edge-on, type 2
           # view.Possible values are: 0, 10, 20, 30, 40, 50, 60, 70, 80, and 90.
-          i = {self.i}
+          i = {i}
           # AGN fraction.
-          fracAGN = {self.fracAGN}
+          fracAGN = {fracAGN}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[skirtor2016]]
           t = cigale_list(options=3 & 5 & 7 & 9 & 11)
           pl = cigale_list(options=0. & .5 & 1. & 1.5)
@@ -2520,14 +2200,54 @@ class SKIRTORmodule(AGNmodule):
           i = cigale_list(options=0 & 10 & 20 & 30 & 40 & 50 & 60 & 70 & 80 & 90)
           fracAGN = cigale_list(minvalue=0., maxvalue=1.)\
         '''
-        
-        return text
     
+    def __init__(self, t: List[int]   = [3],
+                 pl: List[float]      = [1.0],
+                 q: List[float]       = [1.0],
+                 oa: List[int]        = [40],
+                 R: List[float]       = [20.0],
+                 Mcl: List[float]     = [0.97],
+                 i: List[int]         = [40],
+                 fracAGN: List[float] = [0.1]) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('skirtor2016', fracAGN=fracAGN)
+        
+        self.t   =  ListIntProperty(t, minBound=3, maxBound=11,
+                                    testFunc=_notIn(_SKIRTOR_T),
+                                    testMsg=_notInMsg('t', _SKIRTOR_T))
+        
+        
+        self.pl   = ListFloatProperty(pl, minBound=0.0, maxBound=1.5,
+                                      testFunc=_notIn(_SKIRTOR_PL_Q),
+                                      testMsg=_notInMsg('pl', _SKIRTOR_PL_Q))
+        
+        self.q    = ListFloatProperty(q, minBound=0.0, maxBound=1.5,
+                                      testFunc=_notIn(_SKIRTOR_PL_Q),
+                                      testMsg=_notInMsg('q', _SKIRTOR_PL_Q))
+        
+        self.oa   = ListIntProperty(oa, minBound=10, maxBound=80,
+                                    testFunc=_notIn(_SKIRTOR_OA),
+                                    testMsg=_notInMsg('oa', _SKIRTOR_OA))
+        
+        self.R    = ListFloatProperty(R, minBound=10, maxBound=30,
+                                      testFunc=_notIn(_SKIRTOR_R),
+                                      testMsg=_notInMsg('R', _SKIRTOR_R))
+        
+        self.Mcl  = ListFloatProperty(Mcl, minBound=0.97, maxBound=0.97,
+                                      testFunc=_notIn(_SKIRTOR_MCL),
+                                      testMsg=_notInMsg('Mcl', _SKIRTOR_MCL))
+        
+        self.i    = ListIntProperty(i, minBound=0, maxBound=90,
+                                    testFunc=_notIn(_SKIRTOR_I),
+                                    testMsg=_notInMsg('i', _SKIRTOR_I))
+        
 #######################
 #        Radio        #
 #######################
 
-class RADIOmodule:
+class RADIOmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -2537,53 +2257,64 @@ class RADIOmodule:
     :param list alpha: (**Optional**) the slope of the power-law synchrotron emission
     '''
     
-    def __init__(self, qir: List[float] = [2.58],
-                 alpha: List[float]     = [0.8]) -> None:
-        
-        r'''Init method.'''
-        
-        self.name  = 'radio'
-        self.qir   = ListFloatProperty(qir, minBound=0.0)
-        self.alpha = ListFloatProperty(alpha)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('qir', 'alpha')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[radio]]
           # The value of the FIR/radio correlation coefficient.
-          qir = {self.qir}
+          qir = {qir}
           # The slope of the power-law synchrotron emission.
-          alpha = {self.alpha}
+          alpha = {alpha}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[radio]]
           qir = cigale_list(minvalue=0.)
           alpha = cigale_list()\
         '''
-        
-        return text
     
+    def __init__(self, qir: List[float] = [2.58],
+                 alpha: List[float]     = [0.8]) -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('radio')
+        
+        self.qir   = ListFloatProperty(qir, minBound=0.0)
+        self.alpha = ListFloatProperty(alpha)
+        
 #######################################
 #        Rest-frame parameters        #
 #######################################
 
-class RESTFRAMEmodule:
+#: Usual format for the EW_lines parameter: one or more central wavelength/half-bandwidth pairs of decimal numbers separated by &
+_EW_NUMBER       = r'\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*'
+_EW_LINES_FORMAT = re.compile(rf'{_EW_NUMBER}/{_EW_NUMBER}(?:&{_EW_NUMBER}/{_EW_NUMBER})*')
+
+def _checkEWLines(value: str) -> bool:
+    r'''Return True if the format given for the equivalent widths is not correct.'''
+    
+    # Fast path for the usual format
+    if _EW_LINES_FORMAT.fullmatch(value) is not None:
+        return False
+    
+    # If no / is found, then the format is incorrect
+    if '/' not in value:
+        return True
+    
+    # Otherwise, every value must be castable to float
+    for es in value.split('&'):
+        for e in es.split('/'):
+            try:
+                float(e)
+            except ValueError:
+                return True
+    
+    return False
+
+class RESTFRAMEmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -2596,83 +2327,32 @@ class RESTFRAMEmodule:
     :param str colours_filters: (**Optional**) rest-frame colours to be computed. You can give several colours separated by a & (don't use commas).
     '''
     
-    def __init__(self, beta_calz94: bool = False,
-                 D4000: bool             = False,
-                 IRX: bool               = False,
-                 EW_lines: str           = '500.7/1.0 & 656.3/1.0',
-                 luminosity_filters: str = 'FUV & V_B90',
-                 colours_filters: str    = 'FUV-NUV & NUV-r_prime') -> None:
-        
-        r'''Init method.'''
-        
-        def check_EW(ew):
-            r'''Check that the format given for the equivalent width is correct.'''
-            
-            # If no / is found, then the format is incorrect
-            if '/' not in ew:
-                return True
-             
-            for es in ew.split('&'):
-                for e in es.split('/'):
-                    
-                    # If casting to float does not work, the format is incorrect
-                    try:
-                        float(e)
-                    except ValueError:
-                        return True
-            
-            return False
-        
-        self.name               = 'restframe_parameters'
-        self.beta_calz94        = BoolProperty(beta_calz94)
-        self.D4000              = BoolProperty(D4000)
-        self.IRX                = BoolProperty(IRX)
-        self.EW_lines           = StrProperty(EW_lines, 
-                                              testFunc = check_EW,
-                                              testMsg='The value for EW_lines is not accepted.')
-        
-        self.luminosity_filters = StrProperty(luminosity_filters)
-        self.colours_filters    = StrProperty(colours_filters)
-        
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
+    __slots__ = ('beta_calz94', 'D4000', 'IRX', 'EW_lines', 'luminosity_filters', 'colours_filters')
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
         [[restframe_parameters]]
           # UV slope measured in the same way as in Calzetti et al. (1994).
-          beta_calz94 = {self.beta_calz94}
+          beta_calz94 = {beta_calz94}
           # D4000 break using the Balogh et al. (1999) definition.
-          D4000 = {self.D4000}
+          D4000 = {D4000}
           # IRX computed from the GALEX FUV filter and the dust luminosity.
-          IRX = {self.IRX}
+          IRX = {IRX}
           # Central wavelength of the emission lines for which to compute the
           # equivalent width. The half-bandwidth must be indicated after the '/'
           # sign. For instance 656.3/1.0 means oth the nebular line and the
           # continuum are integrated over 655.3-657.3 nm.
-          EW_lines = {self.EW_lines}
+          EW_lines = {EW_lines}
           # Filters for which the rest-frame luminosity will be computed. You can
           # give several filter names separated by a & (don't use commas).
-          luminosity_filters = {self.luminosity_filters}
+          luminosity_filters = {luminosity_filters}
           # Rest-frame colours to be computed. You can give several colours
           # separated by a & (don't use commas).
-          colours_filters = {self.colours_filters}
+          colours_filters = {colours_filters}
         '''
-        
-        return text
     
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
         [[restframe_parameters]]
           beta_calz94 = boolean()
           D4000 = boolean()
@@ -2681,14 +2361,33 @@ class RESTFRAMEmodule:
           luminosity_filters = string()
           colours_filters = string()\
         '''
-        
-        return text
     
+    def __init__(self, beta_calz94: bool = False,
+                 D4000: bool             = False,
+                 IRX: bool               = False,
+                 EW_lines: str           = '500.7/1.0 & 656.3/1.0',
+                 luminosity_filters: str = 'FUV & V_B90',
+                 colours_filters: str    = 'FUV-NUV & NUV-r_prime') -> None:
+        
+        r'''Init method.'''
+        
+        super().__init__('restframe_parameters')
+        
+        self.beta_calz94        = BoolProperty(beta_calz94)
+        self.D4000              = BoolProperty(D4000)
+        self.IRX                = BoolProperty(IRX)
+        self.EW_lines           = StrProperty(EW_lines, 
+                                              testFunc = _checkEWLines,
+                                              testMsg='The value for EW_lines is not accepted.')
+        
+        self.luminosity_filters = StrProperty(luminosity_filters)
+        self.colours_filters    = StrProperty(colours_filters)
+        
 #############################
 #        Redshifting        #
 #############################
 
-class REDSHIFTmodule:
+class REDSHIFTmodule(CIGALEmodule):
     r'''
     .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
     
@@ -2697,45 +2396,31 @@ class REDSHIFTmodule:
     :param list redshift: redshift of the objects. Leave empty to use the redshifts from the input file.
     '''
     
+    __slots__ = ('redshift',)
+    
+    #: Template used to make Cigale parameter files
+    _TEMPLATE = '''\
+        [[redshifting]]
+          # Redshift of the objects. Leave empty to use the redshifts from the
+          # input file.
+          redshift = {redshift}
+        '''
+    
+    #: Text used to make the .spec file of Cigale parameters
+    spec = '''\
+        [[redshifting]]
+          redshift = cigale_list(minvalue=0.)\
+        '''
+    
     def __init__(self, redshift: List[float] = []) -> None:
         
         r'''Init method.'''
         
-        self.name         = 'redshifting'
+        super().__init__('redshifting')
         
-        if redshift == []:
+        if not redshift:
             self.redshift = StrProperty('')
         else:
             self.redshift = ListFloatProperty(redshift, minBound=0.0)
             
         
-    def __str__(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation of the class used to make Cigale parameter files.
-        '''
-        
-        text = f'''\
-        [[redshifting]]
-          # Redshift of the objects. Leave empty to use the redshifts from the
-          # input file.
-          redshift = {self.redshift}
-        '''
-        
-        return text
-    
-    @property
-    def spec(self, *args, **kwargs) -> str:
-        r'''
-        .. codeauthor:: Wilfried Mercier - IRAP <wilfried.mercier@irap.omp.eu>
-        
-        Implement a string representation for the .spec file of Cigale parameters.
-        '''
-        
-        text = '''\
-        [[redshifting]]
-          redshift = cigale_list(minvalue=0.)\
-        '''
-        
-        return text
\ No newline at end of file
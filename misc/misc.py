@@ -10,6 +10,7 @@ import numpy         as     np
 from   numpy         import ndarray
 from   astropy.units import Unit, Quantity
 from   typing        import Any
+from   functools     import wraps
 
 ##############################################
 #        Custom errors and exceptions        #
@@ -101,6 +102,38 @@ def check_type_in_list(dtype):
             return func(*args, **kwargs)
         return wrap
     return decorator
+
+def cache_on_value(func):
+    r'''
+    .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+    
+    A decorator which caches the output of a method of an object with a **value** attribute. The cached output is returned as long as **value** is the same object, so that setting a new value invalidates the cache.
+    
+    The name of the attribute holding the cache is stored in the **cacheName** attribute of the decorated method. Setting that attribute to :python:`None` clears the cache.
+    
+    .. note::
+        
+        Values modified in place are not detected. Objects which store mutable values (e.g. lists) must therefore store a copy when a new value is set, so that a value modified in place and set again is a new object.
+    
+    :param function func: function to be decorated
+    '''
+    
+    name = f'_{func.__name__.strip("_")}Cache'
+    
+    @wraps(func)
+    def wrap(self, *args, **kwargs):
+        cache = getattr(self, name, None)
+        
+        if cache is not None and cache[0] is self.value:
+            return cache[1]
+        
+        out   = func(self, *args, **kwargs)
+        setattr(self, name, (self.value, out))
+        return out
+    
+    #: Name of the attribute holding the cache, so that it can be cleared
+    wrap.cacheName = name
+    return wrap
  
 ##########################
 #      Custom class      #
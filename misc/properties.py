@@ -9,8 +9,14 @@ Property classes used in other parts of the code.
 from   abc     import ABC, abstractmethod
 from   typing  import Any, Callable, List, Optional
 from   enum    import Enum
-from   .misc   import check_type, check_type_in_list
+from   .misc   import check_type, check_type_in_list, cache_on_value
 import os.path as     opath
+import numpy   as     np
+
+def _noTest(value: Any) -> bool:
+    r'''Default test function of the properties which accepts any value. It is a module-level function so that properties can be pickled.'''
+    
+    return False
 
 ########################################
 #           Property objects           #
@@ -48,7 +54,7 @@ class Property(ABC):
     def __init__(self, default: Any,
                  minBound: Optional[Any] = None, 
                  maxBound: Optional[Any] = None, 
-                 testFunc: Callable[[Any], bool] = lambda value: False, 
+                 testFunc: Callable[[Any], bool] = _noTest, 
                  testMsg: str ='', 
                  **kwargs) -> None:
         r'''Init method.'''
@@ -86,6 +92,20 @@ class Property(ABC):
     #        Miscellaneous        #
     ###############################
     
+    def clearCache(self, *args, **kwargs) -> None:
+        r'''
+        .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+        
+        Clear the cached string representation, if any. This must be called if the value is modified in place rather than with the :python:`set` method.
+        '''
+        
+        name = getattr(type(self).__str__, 'cacheName', None)
+        
+        if name is not None:
+            setattr(self, name, None)
+            
+        return
+    
     @staticmethod
     def check_bounds(value: Any, mini: Any, maxi: Any, func: Callable, msg: str) -> None:
         r'''
@@ -149,8 +169,11 @@ class BoolProperty(Property):
     :type testMsg: :python:`str`
     '''
     
+    #: String representations of the boolean values
+    _STR = {True: 'True', False: 'False'}
+    
     def __init__(self, default: bool,
-                 testFunc: Callable[[Any], bool] = lambda value: False, 
+                 testFunc: Callable[[Any], bool] = _noTest, 
                  testMsg: str ='', **kwargs) -> None:
         
         r'''Init method.'''
@@ -170,7 +193,9 @@ class BoolProperty(Property):
         :rtype: :python:`str`
         '''
         
-        return f'{self.value}'
+        # Booleans are mapped directly, other values (e.g. '-1') are formatted
+        text = self._STR.get(self.value)
+        return text if text is not None else f'{self.value}'
     
     @check_type(bool)
     def set(self, value: bool, *args, **kwargs) -> None:
@@ -214,7 +239,7 @@ class IntProperty(Property):
     def __init__(self, default: int,
                  minBound: int = None, 
                  maxBound: int = None, 
-                 testFunc: Callable[[int], bool] = lambda value: False, 
+                 testFunc: Callable[[int], bool] = _noTest, 
                  testMsg: str ='', **kwargs) -> None:
         
         r'''Init method.'''
@@ -276,7 +301,7 @@ class FloatProperty(Property):
     def __init__(self, default: float,
                  minBound: float = None, 
                  maxBound: float = None, 
-                 testFunc: Callable[[float], bool] = lambda value: False, 
+                 testFunc: Callable[[float], bool] = _noTest, 
                  testMsg: str ='', **kwargs) -> None:
         
         r'''Init method.'''
@@ -286,6 +311,7 @@ class FloatProperty(Property):
         # Set the value to check data type (default property has already been set)
         self.set(default)
         
+    @cache_on_value
     def __str__(self, *args, **kwargs) -> str:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -341,7 +367,7 @@ class StrProperty(Property):
     '''
     
     def __init__(self, default: str,
-                 testFunc: Callable[[str], bool] = lambda value: False, 
+                 testFunc: Callable[[str], bool] = _noTest, 
                  testMsg: str ='', **kwargs) -> None:
         
         r'''Init method.'''
@@ -411,7 +437,7 @@ class ListProperty(Property):
     def __init__(self, default: List[Any],
                  minBound: Any = None, 
                  maxBound: Any = None, 
-                 testFunc: Callable[[List[Any]], bool] = lambda value: False, 
+                 testFunc: Callable[[List[Any]], bool] = _noTest, 
                  testMsg: str ='', **kwargs) -> None:
         
         r'''Init method.'''
@@ -422,6 +448,9 @@ class ListProperty(Property):
     #        Miscellaneous        #
     ###############################
     
+    #: Length above which bounds are checked with numpy rather than with a Python loop
+    _vectorSize = 64
+    
     @staticmethod
     def check_bounds(value: List[Any], mini: Any, maxi: Any, func: Callable, msg: str) -> None:
         r'''
@@ -443,11 +472,22 @@ class ListProperty(Property):
             * if the test function is not passed
         '''
         
-        if mini is not None and any((i < mini for i in value)):
-            raise ValueError(f'value is {value} but minimum acceptable bound is {mini}.')
+        # Long lists are checked with a single vectorised comparison rather than a Python loop
+        if (mini is not None or maxi is not None) and len(value) > ListProperty._vectorSize:
+            arr = np.asarray(value)
+            
+            if mini is not None and (arr < mini).any():
+                raise ValueError(f'value is {value} but minimum acceptable bound is {mini}.')
+            
+            if maxi is not None and (arr > maxi).any():
+                raise ValueError(f'value is {value} but maximum acceptable bound is {maxi}.')
         
-        if maxi is not None and any((i > maxi for i in value)):
-            raise ValueError(f'value is {value} but maximum acceptable bound is {maxi}.')
+        else:
+            if mini is not None and any((i < mini for i in value)):
+                raise ValueError(f'value is {value} but minimum acceptable bound is {mini}.')
+            
+            if maxi is not None and any((i > maxi for i in value)):
+                raise ValueError(f'value is {value} but maximum acceptable bound is {maxi}.')
             
         if func(value):
             raise ValueError(msg)
@@ -493,7 +533,7 @@ class ListIntProperty(ListProperty):
     def __init__(self, default: List[int],
                  minBound: int = None, 
                  maxBound: int = None, 
-                 testFunc: Callable[[List[int]], bool] = lambda value: False, 
+                 testFunc: Callable[[List[int]], bool] = _noTest, 
                  testMsg: str ='', 
                  **kwargs) -> None:
         
@@ -504,6 +544,7 @@ class ListIntProperty(ListProperty):
         # Set the value to check data type (default property has already been set)
         self.set(default)
         
+    @cache_on_value
     def __str__(self, *args, **kwargs) -> str:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -529,7 +570,8 @@ class ListIntProperty(ListProperty):
         '''
         
         self.check_bounds(value, self.min, self.max, self._testFunc, self._testMsg)
-        self.value = value
+        # A copy is stored so that the list given by the caller can be modified and set again without leaving a stale string representation
+        self.value = list(value)
         return
     
 class ListFloatProperty(ListProperty):
@@ -558,7 +600,7 @@ class ListFloatProperty(ListProperty):
     def __init__(self, default: List[float],
                  minBound: float = None, 
                  maxBound: float = None, 
-                 testFunc: Callable[[List[float]], bool] = lambda value: False, 
+                 testFunc: Callable[[List[float]], bool] = _noTest, 
                  testMsg: str ='', 
                  **kwargs) -> None:
         
@@ -569,6 +611,7 @@ class ListFloatProperty(ListProperty):
         # Set the value to check data type (default property has already been set)
         self.set(default)
         
+    @cache_on_value
     def __str__(self, *args, **kwargs) -> str:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -594,7 +637,8 @@ class ListFloatProperty(ListProperty):
         '''
         
         self.check_bounds(value, self.min, self.max, self._testFunc, self._testMsg)
-        self.value = value
+        # A copy is stored so that the list given by the caller can be modified and set again without leaving a stale string representation
+        self.value = list(value)
         return
 
 class ListStrProperty(ListProperty):
@@ -617,7 +661,7 @@ class ListStrProperty(ListProperty):
     '''
     
     def __init__(self, default: List[str],
-                 testFunc: Callable[[List[str]], bool] = lambda value: False, 
+                 testFunc: Callable[[List[str]], bool] = _noTest, 
                  testMsg: str ='', **kwargs) -> None:
         
         r'''Init method.'''
@@ -627,6 +671,7 @@ class ListStrProperty(ListProperty):
         # Set the value to check data type (default property has already been set)
         self.set(default)
         
+    @cache_on_value
     def __str__(self, *args, **kwargs) -> str:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -656,7 +701,8 @@ class ListStrProperty(ListProperty):
         if self._testFunc(value):
             raise ValueError(self._testMsg)
         
-        self.value = value
+        # A copy is stored so that the list given by the caller can be modified and set again without leaving a stale string representation
+        self.value = list(value)
         return
 
 
@@ -692,7 +738,7 @@ class PathProperty(Property):
     '''
 
     def __init__(self, default: str,
-                 testFunc: Callable[[str], bool] = lambda value: False, 
+                 testFunc: Callable[[str], bool] = _noTest, 
                  testMsg: str                    ='', 
                  path: str                       = '', 
                  ext: str                        = '', 
@@ -808,7 +854,7 @@ class ListPathProperty(ListProperty):
     '''
 
     def __init__(self, default: List[str],
-                 testFunc: Callable[[List[str]], bool] = lambda value: False, 
+                 testFunc: Callable[[List[str]], bool] = _noTest, 
                  testMsg: str ='', 
                  path: str = '', 
                  ext: str = '', 
@@ -833,6 +879,7 @@ class ListPathProperty(ListProperty):
         # Set the value to check data type (default property has already been set)
         self.set(default)
         
+    @cache_on_value
     def __str__(self, *args, **kwargs) -> str:
         r'''
         .. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
@@ -871,7 +918,8 @@ class ListPathProperty(ListProperty):
         if self._testFunc(value):
             raise ValueError(self._testMsg)
         
-        self.value = value
+        # A copy is stored so that the list given by the caller can be modified and set again without leaving a stale string representation
+        self.value = list(value)
         return
     
 #####################################
@@ -898,7 +946,7 @@ class EnumProperty(Property):
     '''
     
     def __init__(self, value: Enum, 
-                 testFunc: Callable[[List[str]], bool] = lambda value: False, 
+                 testFunc: Callable[[List[str]], bool] = _noTest, 
                  testMsg: str ='', 
                  **kwargs) -> None:
     
@@ -290,18 +290,17 @@ class CigaleSED(SED):
         #: Redshifting modules to use
         self.redshifting: cigmod.REDSHIFTmodule    = self._checkModule(redshifting, cigmod.REDSHIFTmodule)
         
+        modules                                     = self.SFH + self.SSP + self.nebular + self.attenuation + self.dust + self.agn + self.radio + self.restframe + self.redshifting
+        
         #: Modules names list
-        self.moduleNames: ListStrProperty           = ListStrProperty([i.name for i in self.SFH + self.SSP + self.nebular + self.attenuation + self.dust + self.agn + self.radio + self.restframe + self.redshifting])
+        self.moduleNames: ListStrProperty           = ListStrProperty([i.name for i in modules])
         
+        # Texts are gathered and joined once rather than concatenated module after module (module templates are already dedented when their class is created)
         #: Modules parameters in str format
-        self.modulesStr: str                        = ''
+        self.modulesStr: str                        = '\n' + '\n\n'.join([str(module) for module in modules]) if modules else ''
         
         #: Modules spec parameters in str format
-        self.modulesSpec: str                       = ''
-        
-        for pos, module in enumerate(self.SFH + self.SSP + self.nebular + self.attenuation + self.dust + self.agn + self.radio + self.restframe + self.redshifting):
-            self.modulesStr                        += f'\n\n{module}' if pos != 0 else f'\n{module}'
-            self.modulesSpec                       += indent(dedent(f'\n{module.spec}' if pos != 0 else f'{module.spec}'), '   ')
+        self.modulesSpec: str                       = ''.join([indent(dedent(f'\n{module.spec}' if pos != 0 else f'{module.spec}'), '   ') for pos, module in enumerate(modules)])
 
     @staticmethod
     def _checkModule(modules: List[Any], inheritedClass: Any) -> List[Any]:
@@ -482,7 +481,7 @@ class CigaleSED(SED):
         [sed_modules_params]
         ''')
         
-        text2 = indent(dedent(f'{self.modulesStr}'), '   ')
+        text2 = indent(self.modulesStr, '   ')
         
         return text1 + text2
     
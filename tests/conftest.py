@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""
+.. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+
+Pytest configuration. The repository root is imported as the pixSED package so that the tests run without installing it.
+"""
+
+import sys
+import os.path           as     opath
+import importlib.util
+
+_ROOT = opath.dirname(opath.dirname(opath.abspath(__file__)))
+
+if 'pixSED' not in sys.modules:
+    _spec                = importlib.util.spec_from_file_location('pixSED', opath.join(_ROOT, '__init__.py'), submodule_search_locations=[_ROOT])
+    _module              = importlib.util.module_from_spec(_spec)
+    sys.modules['pixSED'] = _module
+    _spec.loader.exec_module(_module)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""
+.. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+
+Tests for the Cigale modules.
+"""
+
+import pytest
+import pickle
+import inspect
+from   pixSED import cigmod
+
+###################################
+#        Rest-frame module        #
+###################################
+
+@pytest.mark.parametrize('EW_lines', ['500.7/1.0 & 656.3/1.0', '656.3/.5', '1e3/1', '+656.3/1.0', '656.3/1.', ' 656.3 / 1.0 ', '656.3/1.0/2.0'])
+def test_restframe_EW_lines_accepted(EW_lines):
+    
+    module = cigmod.RESTFRAMEmodule(EW_lines=EW_lines)
+    assert f'EW_lines = {EW_lines}\n' in str(module)
+    
+@pytest.mark.parametrize('EW_lines', ['656.3', 'a/1.0', '656.3/1.0 &', '656.3//1.0', ''])
+def test_restframe_EW_lines_rejected(EW_lines):
+    
+    with pytest.raises(ValueError):
+        cigmod.RESTFRAMEmodule(EW_lines=EW_lines)
+    
+#########################################
+#        Accepted values checks         #
+#########################################
+
+def test_nebular_logU_float_noise():
+    
+    logU   = [0.1*i for i in range(-40, -9)]
+    assert -3.9000000000000004 in logU
+    
+    module = cigmod.NEBULARmodule(logU=logU)
+    assert len(module.logU.value) == 31
+    
+    with pytest.raises(ValueError):
+        cigmod.NEBULARmodule(logU=[-3.95])
+    
+@pytest.mark.parametrize('cls, value', [(cigmod.BC03module, 0.004), (cigmod.M2005module, 0.02)])
+def test_metallicity_float_noise(cls, value):
+    
+    module = cls(metallicity=[value*(1 + 1e-12)])
+    assert module.metallicity.value == [value*(1 + 1e-12)]
+    
+@pytest.mark.parametrize('metallicity', [0.00014, 0.0003, 0.005])
+def test_bc03_metallicity_rejected(metallicity):
+    
+    with pytest.raises(ValueError):
+        cigmod.BC03module(metallicity=[metallicity])
+        
+def test_dale_alpha_float_noise():
+    
+    cigmod.DALEmodule(alpha=[2.00004])
+    
+    with pytest.raises(ValueError):
+        cigmod.DALEmodule(alpha=[2.01])
+    
+############################
+#        SFH modules       #
+############################
+
+_NORMALISE_SFH = [cigmod.SFH2EXPmodule, cigmod.SFHDELAYEDmodule, cigmod.SFHDELAYEDBQmodule, cigmod.SFHPERIODICmodule, 
+                  cigmod.SFH_BUATmodule, cigmod.SFH_QUENCHING_SMOOTHmodule, cigmod.SFH_QUENCHING_TRUNKmodule]
+
+@pytest.mark.parametrize('cls', _NORMALISE_SFH)
+@pytest.mark.parametrize('normalise', [True, False])
+def test_sfh_normalise_section(cls, normalise):
+    
+    text  = str(cls(normalise=normalise))
+    lines = text.split('\n')
+    
+    assert lines[0].startswith('[[')
+    assert all(line.startswith('  ') for line in lines[1:-1])
+    assert text.endswith(f'\n  # Normalise the SFH to produce one solar mass.\n  normalise = {normalise}\n')
+    
+def test_sfhdelayedbq_str():
+    
+    assert str(cigmod.SFHDELAYEDBQmodule()) == ('[[sfhdelayedbq]]\n'
+                                                '  # e-folding time of the main stellar population model in Myr.\n'
+                                                '  tau_main = 2000\n'
+                                                '  # Age of the main stellar population in the galaxy in Myr. The precision\n'
+                                                '  # is 1 Myr.\n'
+                                                '  age_main = 5000\n'
+                                                '  # Age of the burst/quench episode. The precision is 1 Myr.\n'
+                                                '  age_bq = 500\n'
+                                                '  # Ratio of the SFR after/before age_bq.\n'
+                                                '  r_sfr = 0.100\n'
+                                                '  # Multiplicative factor controlling the SFR if normalise is False. For\n'
+                                                '  # instance without any burst/quench: SFR(t)=sfr_A×t×exp(-t/τ)/τ²\n'
+                                                '  sfr_A = 1.000\n'
+                                                '  # Normalise the SFH to produce one solar mass.\n'
+                                                '  normalise = True\n')
+    
+##########################
+#        Pickling        #
+##########################
+
+_MODULES = [cls for name, cls in vars(cigmod).items() if name.endswith('module') and isinstance(cls, type) and not inspect.isabstract(cls) and cls is not cigmod.SFHFROMFILEmodule]
+
+@pytest.mark.parametrize('cls', _MODULES)
+def test_pickle(cls):
+    
+    module = cls()
+    copy   = pickle.loads(pickle.dumps(module))
+    
+    assert type(copy) is cls
+    assert str(copy) == str(module)
+    
+def test_pickle_keeps_checks():
+    
+    copy = pickle.loads(pickle.dumps(cigmod.BC03module()))
+    
+    with pytest.raises(ValueError):
+        copy.metallicity.set([0.03])
+    
+def test_template_fields_checked():
+    
+    with pytest.raises(TypeError):
+        
+        class BADmodule(cigmod.SKIRTORmodule):
+            
+            __slots__ = ()
+            _TEMPLATE = '''\
+                [[skirtor2016]]
+                  t = {ts}
+                '''
+    
+#################################
+#        Attenuation laws       #
+#################################
+
+def test_dustatt_2powerlaws_str():
+    
+    module = cigmod.DUSTATT_2POWERLAWSmodule(Av_BC=[0.5, 1.5], slope_BC=[-1.0], BC_to_ISM_factor=[0.3], slope_ISM=[-0.5])
+    assert str(module) == ('[[dustatt_2powerlaws]]\n'
+                           '  # V-band attenuation in the birth clouds.\n'
+                           '  Av_BC = 0.500,1.500\n'
+                           '  # Power law slope of the attenuation in the birth clouds.\n'
+                           '  slope_BC = -1.000e+00\n'
+                           '  # Av ISM / Av BC (<1).\n'
+                           '  BC_to_ISM_factor = 0.300\n'
+                           '  # Power law slope of the attenuation in the ISM.\n'
+                           '  slope_ISM = -5.000e-01\n'
+                           '  # Filters for which the attenuation will be computed and added to the\n'
+                           '  # SED information dictionary. You can give several filter names\n'
+                           '  # separated by a & (don\'t use commas).\n'
+                           '  filters = V_B90 & FUV\n')
+    
+def test_dustatt_modified_CF00_str():
+    
+    module = cigmod.DUSTATT_MODIFIED_CF00module(Av_ISM=[2.0], mu=[0.3], slope_ISM=[-0.5], slope_BC=[-1.0])
+    assert module.slope_ISM.value == [-0.5]
+    assert module.slope_BC.value  == [-1.0]
+    assert str(module) == ('[[dustatt_modified_CF00]]\n'
+                           '  # V-band attenuation in the interstellar medium.\n'
+                           '  Av_ISM = 2.000\n'
+                           '  # Av_ISM / (Av_BC+Av_ISM)\n'
+                           '  mu = 0.300\n'
+                           '  # Power law slope of the attenuation in the ISM.\n'
+                           '  slope_ISM = -5.000e-01\n'
+                           '  # Power law slope of the attenuation in the birth clouds.\n'
+                           '  slope_BC = -1.000e+00\n'
+                           '  # Filters for which the attenuation will be computed and added to the\n'
+                           '  # SED information dictionary. You can give several filter names\n'
+                           '  # separated by a & (don\'t use commas).\n'
+                           '  filters = V_B90 & FUV\n')
+    
+def test_dustatt_calzleit_str():
+    
+    module = cigmod.DUSTATT_CALZLETTImodule(E_BVs_old_factor=[0.44, 1.0])
+    assert str(module) == ('[[dustatt_calzleit]]\n'
+                           '  # E(B-V)*, the colour excess of the stellar continuum light for the\n'
+                           '  # young population.\n'
+                           '  E_BVs_young = 0.300\n'
+                           '  # Reduction factor for the E(B-V)* of the old population compared to the\n'
+                           '  # young one (<1).\n'
+                           '  E_BVs_old_factor = 0.440,1.000\n'
+                           '  # Central wavelength of the UV bump in nm.\n'
+                           '  uv_bump_wavelength = 217.500\n'
+                           '  # Width (FWHM) of the UV bump in nm.\n'
+                           '  uv_bump_width = 35.000\n'
+                           '  # Amplitude of the UV bump. For the Milky Way: 3.\n'
+                           '  uv_bump_amplitude = 0.000\n'
+                           '  # Slope delta of the power law modifying the attenuation curve.\n'
+                           '  powerlaw_slope = 0.000\n'
+                           '  # Filters for which the attenuation will be computed and added to the\n'
+                           '  # SED information dictionary. You can give several filter names\n'
+                           '  # separated by a & (don\'t use commas).\n'
+                           '  filters = B_B90 & V_B90 & FUV\n')
+    
+    with pytest.raises(ValueError):
+        cigmod.DUSTATT_CALZLETTImodule(E_BVs_old_factor=[1.1])
+        
+def test_dustatt_modified_starburst_str():
+    
+    module = cigmod.DUSTATT_MODIFIED_STARBURSTmodule()
+    text   = str(module)
+    
+    assert module.name == 'dustatt_modified_starburst'
+    assert text.startswith('[[dustatt_modified_starburst]]\n')
+    assert '\n  E_BV_factor = 0.440\n' in text
+    assert '\n  Ext_law_emission_lines = 1\n' in text
+    assert '\n  Rv = 3.100\n' in text
+    assert text.endswith('\n  filters = B_B90 & V_B90 & FUV\n')
+    
+    text   = str(cigmod.DUSTATT_MODIFIED_STARBURSTmodule(Ext_law_emission_lines=[1, 3], Rv=[2.93]))
+    assert '\n  Ext_law_emission_lines = 1,3\n' in text
+    assert '\n  Rv = 2.930\n' in text
+    
+############################
+#        Text cache        #
+############################
+
+def test_str_cache_after_set():
+    
+    module = cigmod.SFHDELAYEDmodule(tau_main=[2000])
+    assert '\n  tau_main = 2000\n' in str(module)
+    
+    module.tau_main.set([500, 1000])
+    assert '\n  tau_main = 500,1000\n' in str(module)
+    
+    module.normalise.set(False)
+    assert str(module).endswith('\n  normalise = False\n')
+    
+def test_str_cache_set_same_list():
+    
+    module = cigmod.SFH2EXPmodule(f_burst=[0.01])
+    assert '\n  f_burst = 0.010\n' in str(module)
+    
+    value  = module.f_burst.value
+    value.append(0.5)
+    module.f_burst.set(value)
+    assert '\n  f_burst = 0.010,0.500\n' in str(module)
+    
+def test_str_cache_after_replace():
+    
+    module           = cigmod.BC03module()
+    assert '\n  metallicity = 0.020\n' in str(module)
+    
+    module.metallicity = cigmod.ListFloatProperty([0.004], minBound=0.0)
+    assert '\n  metallicity = 0.004\n' in str(module)
+    
+def test_str_cache_cleared():
+    
+    module = cigmod.NEBULARmodule(logU=[-2.0])
+    assert '\n  logU = -2.000e+00\n' in str(module)
+    
+    # Values modified in place are only seen once the cache is cleared
+    module.logU.value.append(-3.0)
+    module.clearCache()
+    assert '\n  logU = -2.000e+00,-3.000e+00\n' in str(module)
+    
+###########################
+#        AGN modules      #
+###########################
+
+def test_skirtor2016_str():
+    
+    module = cigmod.SKIRTORmodule(t=[5, 7], R=[30.0], i=[70])
+    assert str(module) == ('[[skirtor2016]]\n'
+                           '  # Average edge-on optical depth at 9.7 micron; the actual one alongthe\n'
+                           '  # line of sight may vary depending on the clumps distribution. Possible\n'
+                           '  # values are: 3, 5, 7, 8, and 11.\n'
+                           '  t = 5,7\n'
+                           '  # Power-law exponent that sets radial gradient of dust density.Possible\n'
+                           '  # values are: 0., 0.5, 1., and 1.5.\n'
+                           '  pl = 1.000\n'
+                           '  # Index that sets dust density gradient with polar angle.Possible values\n'
+                           '  # are:  0., 0.5, 1., and 1.5.\n'
+                           '  q = 1.000\n'
+                           '  # Angle measured between the equatorial plan and edge of the torus.\n'
+                           '  # Half-opening angle of the dust-free cone is 90-oaPossible values are:\n'
+                           '  # 10, 20, 30, 40, 50, 60, 70, and 80\n'
+                           '  oa = 40\n'
+                           '  # Ratio of outer to inner radius, R_out/R_in.Possible values are: 10,\n'
+                           '  # 20, and 30\n'
+                           '  R = 30.000\n'
+                           '  # fraction of total dust mass inside clumps. 0.97 means 97% of total\n'
+                           '  # mass is inside the clumps and 3% in the interclump dust. Possible\n'
+                           '  # values are: 0.97.\n'
+                           '  Mcl = 0.970\n'
+                           '  # inclination, i.e. viewing angle, i.e. position of the instrument\n'
+                           '  # w.r.t. the AGN axis. i=0: face-on, type 1 view; i=90: edge-on, type 2\n'
+                           '  # view.Possible values are: 0, 10, 20, 30, 40, 50, 60, 70, 80, and 90.\n'
+                           '  i = 70\n'
+                           '  # AGN fraction.\n'
+                           '  fracAGN = 0.100\n')
+    
+@pytest.mark.parametrize('cls', [cigmod.FRITZmodule, cigmod.SKIRTORmodule])
+def test_agn_defaults(cls):
+    
+    assert str(cls()).startswith(f'[[{cls().name}]]\n')
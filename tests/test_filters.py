@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""
+.. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+
+Tests for the FilterList class.
+"""
+
+import numpy         as     np
+import pytest
+from   astropy.io    import fits
+from   pixSED        import Filter, FilterList, SEDcode
+
+#################################
+#        Helper functions       #
+#################################
+
+@pytest.fixture
+def filters(tmp_path):
+    r'''Two small filters with random data and variance maps.'''
+    
+    rng  = np.random.default_rng(0)
+    out  = []
+    
+    for name in ['F606W', 'F814W']:
+        data = rng.uniform(1, 10, size=(6, 5))
+        var  = rng.uniform(0.1, 1, size=(6, 5))
+        
+        fits.PrimaryHDU(data).writeto(tmp_path / f'{name}.fits')
+        fits.PrimaryHDU(var).writeto( tmp_path / f'{name}_var.fits')
+        
+        out.append(Filter(name, str(tmp_path / f'{name}.fits'), str(tmp_path / f'{name}_var.fits'), 25.0, verbose=False))
+        
+    return out
+
+###############################
+#        setCode cache        #
+###############################
+
+def test_setCode_redshift_invalidates_cache(filters):
+    
+    flist          = FilterList(filters, redshift=0.3)
+    assert np.all(flist.table['redshift'] == 0.3)
+    
+    flist.redshift = 1.5
+    flist.setCigale()
+    assert np.all(flist.table['redshift'] == 1.5)
+    
+def test_setCode_mask_invalidates_cache(filters):
+    
+    flist          = FilterList(filters)
+    nrows          = len(flist.table)
+    
+    mask           = np.full(flist.shape, False)
+    mask[0]        = True
+    flist.mask     = mask
+    flist.setCigale()
+    assert len(flist.table) == nrows - flist.shape[1]
+    
+def test_setCode_filters_invalidates_cache(filters):
+    
+    flist          = FilterList(filters)
+    flist.filters  = flist.filters[:1]
+    flist.setCigale()
+    assert 'F814W' not in flist.table.colnames
+    
+def test_setCode_returns_copies(filters):
+    
+    flist          = FilterList(filters, redshift=0.3)
+    flist.table['redshift'][:] = 5
+    
+    flist.setLePhare()
+    flist.setCigale()
+    assert np.all(flist.table['redshift'] == 0.3)
+    
+    flist.table['redshift'][:] = 5
+    flist.setCigale()
+    assert np.all(flist.table['redshift'] == 0.3)
+    
+def test_setCode_reuses_cache(filters):
+    
+    flist          = FilterList(filters, redshift=0.3)
+    flist.setLePhare()
+    lephare        = flist.table
+    
+    flist.setCigale()
+    flist.setLePhare()
+    assert flist.table is not lephare
+    assert flist.table.colnames == lephare.colnames
+    assert all(np.array_equal(flist.table[c], lephare[c]) for c in lephare.colnames)
+    
+#######################
+#        scale        #
+#######################
+
+def _refScale(data, var, norm, factor):
+    r'''Reference scaling computed element-wise.'''
+    
+    mask    = norm != 0
+    d, v    = data.copy(), var.copy()
+    d[mask] = factor*data[mask]/norm[mask]
+    v[mask] = factor**2*var[mask]/norm[mask]**2
+    return d, v
+
+@pytest.mark.parametrize('zero', [False, True])
+def test_scale_norm_modified_in_place(filters, zero):
+    
+    flist   = FilterList(filters)
+    rng     = np.random.default_rng(1)
+    data    = rng.uniform(1, 10, size=flist.shape)
+    var     = rng.uniform(1, 10, size=flist.shape)
+    norm    = rng.uniform(1, 10, size=flist.shape)
+    
+    if zero:
+        norm[0, 0] = 0
+    
+    flist.scale(data, var, norm, factor=100)
+    norm   *= 3
+    d, v    = flist.scale(data, var, norm, factor=100)
+    
+    dr, vr  = _refScale(data, var, norm, 100)
+    assert np.allclose(d, dr) and np.allclose(v, vr)
+    
+@pytest.mark.parametrize('factor', [1, 100])
+def test_scale_with_precomputed_inverse(filters, factor):
+    
+    flist   = FilterList(filters)
+    rng     = np.random.default_rng(2)
+    data    = rng.uniform(1, 10, size=flist.shape)
+    var     = rng.uniform(1, 10, size=flist.shape)
+    norm    = rng.uniform(1, 10, size=flist.shape)
+    norm[1] = 0
+    
+    inverse = flist.normInverse(norm)
+    d, v    = flist.scale(data, var, norm, factor=factor, inverse=inverse)
+    dr, vr  = _refScale(data, var, norm, factor)
+    assert np.allclose(d, dr) and np.allclose(v, vr)
+    
+    # The shared inverse must not be modified by scale
+    assert np.array_equal(inverse[1], 1/norm[inverse[0]])
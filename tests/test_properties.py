@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+r"""
+.. codeauthor:: Wilfried Mercier - IRAP/LAM <wilfried.mercier@lam.fr>
+
+Tests for the property classes.
+"""
+
+import pytest
+from   pixSED.misc.properties import FloatProperty, ListIntProperty, ListFloatProperty, ListStrProperty, ListPathProperty
+
+#####################################
+#        String representation      #
+#####################################
+
+@pytest.mark.parametrize('cls, first, second, expected', [(FloatProperty,     1.5,          2000.0,       '2.000e+03'),
+                                                           (ListIntProperty,   [1, 2],       [3],          '3'),
+                                                           (ListFloatProperty, [1.5],        [0.2, 0.0],   '0.200,0.000'),
+                                                           (ListStrProperty,   ['a', 'b'],   ['c'],        'c')])
+def test_str_cache_after_set(cls, first, second, expected):
+    
+    prop = cls(first)
+    str(prop)
+    
+    prop.set(second)
+    assert str(prop) == expected
+    
+@pytest.mark.parametrize('cls, first, added, expected', [(ListIntProperty,   [1],   2,   '1,2'),
+                                                          (ListFloatProperty, [0.01], 0.02, '0.010,0.020'),
+                                                          (ListStrProperty,   ['a'],  'b',  'a,b')])
+def test_str_cache_set_same_list(cls, first, added, expected):
+    
+    prop = cls(first)
+    str(prop)
+    
+    first.append(added)
+    prop.set(first)
+    assert str(prop) == expected
+    
+def test_str_cache_in_place_change():
+    
+    prop = ListFloatProperty([1.5])
+    assert str(prop) == '1.500'
+    
+    # Values modified in place are only seen once the cache is cleared
+    prop.value.append(2.5)
+    assert str(prop) == '1.500'
+    
+    prop.clearCache()
+    assert str(prop) == '1.500,2.500'
+    
+    # Setting the modified value again also rebuilds the string
+    prop.value.append(3.5)
+    prop.set(prop.value)
+    assert str(prop) == '1.500,2.500,3.500'
+    
+def test_list_path_str_cache_after_set(tmp_path):
+    
+    for name in ['a', 'b']:
+        (tmp_path / name).touch()
+        
+    prop = ListPathProperty(['a'], path=str(tmp_path))
+    assert str(prop) == 'a'
+    
+    prop.set(['a', 'b'])
+    assert str(prop) == 'a,b'
+    
+    paths = ['a']
+    prop.set(paths)
+    assert str(prop) == 'a'
+    
+    paths.append('b')
+    prop.set(paths)
+    assert str(prop) == 'a,b'